@@ -2,7 +2,6 @@ import random
 from typing import TYPE_CHECKING
 from urllib.parse import parse_qs, urlsplit
 
-import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands
@@ -11,6 +10,7 @@ from .commons import REG_EXP, USER_AGENTS
 
 if TYPE_CHECKING:
     from dBot import dBot
+    from helpers.http_client import HttpClient
 
 
 class Coupon(commands.Cog):
@@ -29,22 +29,22 @@ class Coupon(commands.Cog):
 
         await itr.response.defer()
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    link,
-                    allow_redirects=False,
-                    headers={"User-Agent": random.choice(USER_AGENTS)},
-                ) as r:
-                    if redirect := r.headers.get("Location"):
-                        queries = parse_qs(
-                            parse_qs(urlsplit(redirect).query)["referrer"][0]
-                        )
-                    else:
-                        queries = parse_qs(
-                            urlsplit(
-                                REG_EXP.search(await r.text()).group(1)  # type: ignore
-                            ).query
-                        )
+            http_cog: "HttpClient" = self.bot.get_cog("HttpClient")
+            async with http_cog.session.get(
+                link,
+                allow_redirects=False,
+                headers={"User-Agent": random.choice(USER_AGENTS)},
+            ) as r:
+                if redirect := r.headers.get("Location"):
+                    queries = parse_qs(
+                        parse_qs(urlsplit(redirect).query)["referrer"][0]
+                    )
+                else:
+                    queries = parse_qs(
+                        urlsplit(
+                            REG_EXP.search(await r.text()).group(1)  # type: ignore
+                        ).query
+                    )
             code = queries["deep_link_sub1"][0]
             await itr.followup.send(code)
         except Exception as e:
@@ -1,7 +1,6 @@
 # mypy: disable-error-code="assignment"
 # pyright: reportAssignmentType=false, reportTypedDictNotRequiredAccess=false
 
-import asyncio
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -144,17 +143,16 @@ class WorldRecord(commands.GroupCog, name="world_record"):
             await msg.edit(view=view)
             return
 
-        tasks = [
-            cog.get_world_record(
-                game_choice.value, season_code, int(song[song_id_index]), True
-            )
-            for song in songs
-        ]
-        results = await asyncio.gather(*tasks)
+        results = await cog.get_world_records(
+            game_choice.value,
+            season_code,
+            [int(song[song_id_index]) for song in songs],
+            True,
+        )
         world_records = {
             song: (
                 "Error"
-                if isinstance(result, Exception)
+                if isinstance(result, BaseException)
                 else "None" if not result[0] else result[0][0]
             )
             for song, result in zip(
@@ -165,7 +163,7 @@ class WorldRecord(commands.GroupCog, name="world_record"):
             (
                 result[1]
                 for result in results
-                if not isinstance(result, Exception) and result[1]
+                if not isinstance(result, BaseException) and result[1]
             ),
             default=None,
         )
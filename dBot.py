@@ -26,6 +26,8 @@ class dBot(commands.Bot):
     info_by_id: dict[str, dict[str, list[str]]] = {}
     info_from_file: dict[str, dict[str, dict]] = {}
 
+    dalcom: dict[str, dict[str, dict[str, dict] | None]] = {}
+
     bonus: dict[str, dict[str, list[list]]] = {}
 
     artist: dict[str, dict[str, ArtistDetails]] = {}
@@ -92,18 +94,19 @@ class dBot(commands.Bot):
             LOCK.unlink(missing_ok=True)
 
 
-bot = dBot(
-    command_prefix=["db!", "DB!", "dB!", "Db!"],
-    help_command=None,
-    intents=discord.Intents.all(),
-    status=discord.Status.idle,
-    activity=discord.CustomActivity("Waiting for clock..."),
-    member_cache_flags=discord.MemberCacheFlags.all(),
-)
-bot.owner_id = 180925261531840512
+if __name__ == "__main__":
+    bot = dBot(
+        command_prefix=["db!", "DB!", "dB!", "Db!"],
+        help_command=None,
+        intents=discord.Intents.all(),
+        status=discord.Status.idle,
+        activity=discord.CustomActivity("Waiting for clock..."),
+        member_cache_flags=discord.MemberCacheFlags.all(),
+    )
+    bot.owner_id = 180925261531840512
 
-load_dotenv()
-bot.run(
-    os.getenv("DISCORD_TOKEN"),  # type: ignore[arg-type]
-    root_logger=True,
-)
+    load_dotenv()
+    bot.run(
+        os.getenv("DISCORD_TOKEN"),  # type: ignore[arg-type]
+        root_logger=True,
+    )
@@ -1,5 +1,8 @@
-SERVICE_NAME = "drive"
-VERSION = "v3"
+from yarl import URL
+
+BASE_URL = URL("https://www.googleapis.com/drive/v3/files")
+UPLOAD_URL = URL("https://www.googleapis.com/upload/drive/v3/files")
 SCOPES = ["https://www.googleapis.com/auth/drive.file"]
-STATIC_DISCOVERY = True
 TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+MULTIPART_LIMIT = 5242880  # 5 MiB
+STREAM_CHUNK_SIZE = 1048576  # 1 MiB
@@ -3,55 +3,57 @@
 # pyright: reportMissingModuleSource=false, reportTypedDictNotRequiredAccess=false
 
 import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime
-from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import aiohttp
 from discord.ext import commands
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from yarl import URL
 
-from statics.consts import MAX_RETRIES
+from helpers.http_client.types import GoogleCredentials
 
 from .commons import (
+    BASE_URL,
+    MULTIPART_LIMIT,
     SCOPES,
-    SERVICE_NAME,
-    STATIC_DISCOVERY,
+    STREAM_CHUNK_SIZE,
     TIME_FORMAT,
-    VERSION,
+    UPLOAD_URL,
 )
 
 if TYPE_CHECKING:
     from googleapiclient._apis.drive.v3 import File, FileList
+    from googleapiclient.http import MediaFileUpload
 
     from dBot import dBot
+    from helpers.http_client import HttpClient
 
 
 class GoogleDrive(commands.Cog):
     def __init__(self, bot: "dBot") -> None:
         self.bot = bot
-        self.service = build(
-            serviceName=SERVICE_NAME,
-            version=VERSION,
-            credentials=Credentials.from_service_account_file(
-                filename="dBot.json",
-                scopes=SCOPES,
-            ),
-            num_retries=MAX_RETRIES,
-            static_discovery=STATIC_DISCOVERY,
-        ).files()  # pyright: ignore[reportAttributeAccessIssue]
+        self.credentials = GoogleCredentials("dBot.json", SCOPES)
+
+    @property
+    def http_client(self) -> "HttpClient":
+        return self.bot.get_cog("HttpClient")
 
     async def create_file(
         self, metadata: "File", data: "MediaFileUpload | None" = None
     ) -> tuple[str, datetime, str]:
-        result = await asyncio.to_thread(
-            self.service.create(
-                body=metadata, media_body=data, fields="id,modifiedTime,webViewLink"
-            ).execute,
-            num_retries=MAX_RETRIES,
-        )
+        fields = "id,modifiedTime,webViewLink"
+        if data is None:
+            result = await self.http_client.google_json(
+                self.credentials,
+                "POST",
+                BASE_URL,
+                params=[("fields", fields)],
+                json=metadata,
+            )
+        else:
+            result = await self.upload_file("POST", UPLOAD_URL, metadata, data, fields)
         return (
             result["id"],
             datetime.strptime(
@@ -61,38 +63,101 @@ class GoogleDrive(commands.Cog):
             result["webViewLink"],
         )
 
+    async def upload_file(
+        self,
+        method: str,
+        url: URL,
+        metadata: "File",
+        data: "MediaFileUpload",
+        fields: str,
+    ) -> dict:
+        size = data.size()
+        if size <= MULTIPART_LIMIT:
+            content = await asyncio.to_thread(data.getbytes, 0, size)
+
+            def multipart() -> aiohttp.MultipartWriter:
+                writer = aiohttp.MultipartWriter("related")
+                writer.append_json(metadata)
+                writer.append(content, {"Content-Type": data.mimetype()})
+                return writer
+
+            return await self.http_client.google_json(
+                self.credentials,
+                method,
+                url,
+                params=[("uploadType", "multipart"), ("fields", fields)],
+                data=multipart,
+            )
+
+        async with self.http_client.google_request(
+            self.credentials,
+            method,
+            url,
+            params=[("uploadType", "resumable")],
+            json=metadata,
+            headers={
+                "X-Upload-Content-Type": data.mimetype(),
+                "X-Upload-Content-Length": str(size),
+            },
+        ) as r:
+            session_url = r.headers["Location"]
+
+        async def stream() -> AsyncIterator[bytes]:
+            for begin in range(0, size, STREAM_CHUNK_SIZE):
+                yield await asyncio.to_thread(data.getbytes, begin, STREAM_CHUNK_SIZE)
+
+        return await self.http_client.google_json(
+            self.credentials,
+            "PUT",
+            session_url,
+            params=[("fields", fields)],
+            data=stream,
+            headers={"Content-Length": str(size)},
+        )
+
     async def get_file_list(
-        self, parent: str, *, mime_type: str | None = None, next_page: str = ""
+        self,
+        parent: str,
+        *,
+        mime_type: str | None = None,
+        next_page: str = "",
+        fields: str | None = None,
     ) -> "FileList":
-        return await asyncio.to_thread(
-            self.service.list(
-                q=(
-                    f"'{parent}' in parents and trashed=False"
-                    f"{f" and mimeType='{mime_type}'" if mime_type else ""}"
-                ),
-                pageToken=next_page,
-            ).execute,
-            num_retries=MAX_RETRIES,
+        params = [
+            (
+                "q",
+                f"'{parent}' in parents and trashed=False"
+                f"{f" and mimeType='{mime_type}'" if mime_type else ""}",
+            )
+        ]
+        if next_page:
+            params.append(("pageToken", next_page))
+        if fields:
+            params.append(("fields", f"nextPageToken,files({fields})"))
+        return await self.http_client.google_json(
+            self.credentials, "GET", BASE_URL, params=params
         )
 
     async def get_file(self, file_id: str, path: Path) -> None:
-        request = self.service.get_media(fileId=file_id)
-        file = BytesIO()
-        downloader = MediaIoBaseDownload(file, request)
-        done = False
-        while done is False:
-            _, done = await asyncio.to_thread(
-                downloader.next_chunk, num_retries=MAX_RETRIES
-            )
-
-        with open(path, "wb") as f:
-            f.write(file.getbuffer())
-        file.close()
+        temp_path = path.with_suffix(f"{path.suffix}.tmp")
+        async with self.http_client.google_request(
+            self.credentials, "GET", BASE_URL / file_id, params=[("alt", "media")]
+        ) as r:
+            with open(temp_path, "wb") as f:
+                async for chunk in r.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    f.write(chunk)
+        temp_path.replace(path)
+
+    @staticmethod
+    def parse_time(value: str) -> datetime:
+        return datetime.strptime(value, TIME_FORMAT)
 
     async def get_file_last_modified(self, file_id: str) -> datetime:
-        result = await asyncio.to_thread(
-            self.service.get(fileId=file_id, fields="modifiedTime").execute,
-            num_retries=MAX_RETRIES,
+        result = await self.http_client.google_json(
+            self.credentials,
+            "GET",
+            BASE_URL / file_id,
+            params=[("fields", "modifiedTime")],
         )
         return datetime.strptime(
             result["modifiedTime"],
@@ -102,11 +167,8 @@ class GoogleDrive(commands.Cog):
     async def update_drive_file(
         self, file_id: str, data: "MediaFileUpload"
     ) -> datetime:
-        result = await asyncio.to_thread(
-            self.service.update(
-                fileId=file_id, media_body=data, fields="modifiedTime"
-            ).execute,
-            num_retries=MAX_RETRIES,
+        result = await self.upload_file(
+            "PATCH", UPLOAD_URL / file_id, {}, data, "modifiedTime"
         )
         return datetime.strptime(
             result["modifiedTime"],
@@ -1,4 +1,6 @@
-SERVICE_NAME = "sheets"
-VERSION = "v4"
+from yarl import URL
+
+BASE_URL = URL("https://sheets.googleapis.com/v4/spreadsheets")
+BATCH_URL = "https://sheets.googleapis.com/batch"
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
-STATIC_DISCOVERY = True
+BATCH_SIZE = 100
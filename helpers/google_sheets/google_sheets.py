@@ -2,60 +2,57 @@
 # pylint: disable=no-member
 # pyright: reportAttributeAccessIssue=false
 
-import asyncio
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from discord.ext import commands
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
 
-from statics.consts import MAX_RETRIES
+from helpers.http_client.types import GoogleCredentials, GoogleRequest
 
-from .commons import SCOPES, SERVICE_NAME, STATIC_DISCOVERY, VERSION
+from .commons import BASE_URL, BATCH_SIZE, BATCH_URL, SCOPES
 
 if TYPE_CHECKING:
     from dBot import dBot
+    from helpers.http_client import HttpClient
     from statics.types import GridRange
 
 
 class GoogleSheets(commands.Cog):
-    def __init__(self) -> None:
-        self.service = build(
-            serviceName=SERVICE_NAME,
-            version=VERSION,
-            credentials=Credentials.from_service_account_file(
-                filename="dBot.json",
-                scopes=SCOPES,
-            ),
-            num_retries=MAX_RETRIES,
-            static_discovery=STATIC_DISCOVERY,
-        ).spreadsheets()
+    def __init__(self, bot: "dBot") -> None:
+        self.bot = bot
+        self.credentials = GoogleCredentials("dBot.json", SCOPES)
+
+    @property
+    def http_client(self) -> "HttpClient":
+        return self.bot.get_cog("HttpClient")
+
+    async def batch_execute(self, requests: list[GoogleRequest]) -> list[Any]:
+        results = []
+        for start in range(0, len(requests), BATCH_SIZE):
+            results.extend(
+                await self.http_client.google_batch(
+                    self.credentials, BATCH_URL, requests[start : start + BATCH_SIZE]
+                )
+            )
+        return results
 
     async def get_sheet_data(
         self, spreadsheet_id: str, range_str: str
     ) -> list[list[str]]:
-        result = await asyncio.to_thread(
-            self.service.values()
-            .get(
-                spreadsheetId=spreadsheet_id,
-                range=range_str,
-            )
-            .execute,
-            num_retries=MAX_RETRIES,
+        result = await self.http_client.google_json(
+            self.credentials,
+            "GET",
+            BASE_URL / spreadsheet_id / "values" / range_str,
         )
         return result.get("values", [])
 
     async def batch_get_sheet_data(
         self, spreadsheet_id: str, range_strs: list[str]
     ) -> list[list[list[str]]]:
-        result = await asyncio.to_thread(
-            self.service.values()
-            .batchGet(
-                spreadsheetId=spreadsheet_id,
-                ranges=range_strs,
-            )
-            .execute,
-            num_retries=MAX_RETRIES,
+        result = await self.http_client.google_json(
+            self.credentials,
+            "GET",
+            BASE_URL / spreadsheet_id / "values:batchGet",
+            params=[("ranges", range_str) for range_str in range_strs],
         )
         values = result.get("valueRanges", [])
         return [value.get("values", []) for value in values]
@@ -63,18 +60,45 @@ class GoogleSheets(commands.Cog):
     async def update_sheet_data(
         self, spreadsheet_id: str, range_str: str, data: list[list[str]]
     ) -> None:
-        await asyncio.to_thread(
-            self.service.values()
-            .update(
-                spreadsheetId=spreadsheet_id,
-                range=range_str,
-                valueInputOption="RAW",
-                body={"values": data},
-            )
-            .execute,
-            num_retries=MAX_RETRIES,
+        await self.http_client.google_json(
+            self.credentials,
+            "PUT",
+            BASE_URL / spreadsheet_id / "values" / range_str,
+            params=[("valueInputOption", "RAW")],
+            json={"values": data},
         )
 
+    async def batch_update_sheet_data(
+        self, updates: list[tuple[str, str, list[list[str]]]]
+    ) -> list[Exception | None]:
+        spreadsheets: dict[str, list[int]] = {}
+        for i, (spreadsheet_id, _, _) in enumerate(updates):
+            spreadsheets.setdefault(spreadsheet_id, []).append(i)
+
+        results = await self.batch_execute(
+            [
+                GoogleRequest(
+                    "POST",
+                    BASE_URL / spreadsheet_id / "values:batchUpdate",
+                    json={
+                        "valueInputOption": "RAW",
+                        "data": [
+                            {"range": updates[i][1], "values": updates[i][2]}
+                            for i in indexes
+                        ],
+                    },
+                )
+                for spreadsheet_id, indexes in spreadsheets.items()
+            ]
+        )
+
+        errors: list[Exception | None] = [None] * len(updates)
+        for indexes, result in zip(spreadsheets.values(), results):
+            if isinstance(result, Exception):
+                for i in indexes:
+                    errors[i] = result
+        return errors
+
     async def find_replace_sheet_data(
         self,
         spreadsheet_id: str,
@@ -82,30 +106,29 @@ class GoogleSheets(commands.Cog):
         find: str,
         replace: str,
     ) -> None:
-        await asyncio.to_thread(
-            self.service.batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body={
-                    "requests": [
-                        {
-                            "findReplace": {
-                                "find": find,
-                                "replacement": replace,
-                                "matchCase": True,
-                                "matchEntireCell": True,
-                                "searchByRegex": False,
-                                "includeFormulas": False,
-                                "range": range_grid,
-                            }
+        await self.http_client.google_json(
+            self.credentials,
+            "POST",
+            BASE_URL / f"{spreadsheet_id}:batchUpdate",
+            json={
+                "requests": [
+                    {
+                        "findReplace": {
+                            "find": find,
+                            "replacement": replace,
+                            "matchCase": True,
+                            "matchEntireCell": True,
+                            "searchByRegex": False,
+                            "includeFormulas": False,
+                            "range": range_grid,
                         }
-                        for range_grid in range_grids
-                    ],
-                    "includeSpreadsheetInResponse": False,
-                },
-            ).execute,
-            num_retries=MAX_RETRIES,
+                    }
+                    for range_grid in range_grids
+                ],
+                "includeSpreadsheetInResponse": False,
+            },
         )
 
 
 async def setup(bot: "dBot") -> None:
-    await bot.add_cog(GoogleSheets())
+    await bot.add_cog(GoogleSheets(bot))
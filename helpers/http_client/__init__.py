@@ -0,0 +1,16 @@
+import importlib
+
+from statics.consts import LOCK
+
+from . import commons, http_client, types
+
+if LOCK.exists():
+    for module in (commons, types, http_client):
+        importlib.reload(module)
+
+from .http_client import HttpClient, setup
+
+del importlib, commons, http_client, types, LOCK
+
+__all__ = ("setup", "HttpClient")
+__author__ = "ddm135 | Aut"
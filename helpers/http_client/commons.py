@@ -0,0 +1,12 @@
+CONNECTION_LIMIT = 64
+CONNECTION_LIMIT_PER_HOST = 8
+DNS_CACHE_TTL = 300  # 5 minutes
+KEEPALIVE_TIMEOUT = 30
+RATE_LIMIT = 10.0  # requests per second per host
+RATE_BURST = 20
+VALIDATOR_CACHE_BYTES = 67108864  # 64 MiB
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+GOOGLE_BACKOFF_MAX = 64
+GOOGLE_RETRY_STATUSES = (401, 408, 429, 500, 502, 503, 504)
+GOOGLE_TOKEN_LIFETIME = 3600  # 1 hour
+GOOGLE_TOKEN_MARGIN = 300  # 5 minutes
@@ -0,0 +1,231 @@
+import asyncio
+import json
+import random
+from collections import OrderedDict, defaultdict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from email.parser import BytesParser
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+import aiohttp
+from discord.ext import commands
+from yarl import URL
+
+from statics.consts import MAX_RETRIES
+
+from .commons import (
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
+    DNS_CACHE_TTL,
+    GOOGLE_BACKOFF_MAX,
+    GOOGLE_RETRY_STATUSES,
+    KEEPALIVE_TIMEOUT,
+    RATE_BURST,
+    RATE_LIMIT,
+    VALIDATOR_CACHE_BYTES,
+    VALIDATOR_HEADERS,
+)
+from .types import (
+    CachedResponse,
+    GoogleApiError,
+    GoogleCredentials,
+    GoogleRequest,
+    TokenBucket,
+)
+
+if TYPE_CHECKING:
+    from dBot import dBot
+
+
+class HttpClient(commands.Cog):
+    def __init__(self, bot: "dBot") -> None:
+        self.bot = bot
+        self.buckets: defaultdict[str, TokenBucket] = defaultdict(
+            lambda: TokenBucket(RATE_LIMIT, RATE_BURST)
+        )
+        self.throttled: defaultdict[str, float] = defaultdict(float)
+        self.validators: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.validator_bytes = 0
+        self.validator_stats = {"hits": 0, "misses": 0}
+        self.session: aiohttp.ClientSession
+
+    async def cog_load(self) -> None:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self.on_request_start)
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT,
+                limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ),
+            cookie_jar=aiohttp.DummyCookieJar(),
+            trace_configs=[trace_config],
+        )
+
+    async def cog_unload(self) -> None:
+        await self.session.close()
+
+    async def get_conditional(self, url: str) -> CachedResponse:
+        headers = {}
+        if cached := self.validators.get(url):
+            if "ETag" in cached.headers:
+                headers["If-None-Match"] = cached.headers["ETag"]
+            if "Last-Modified" in cached.headers:
+                headers["If-Modified-Since"] = cached.headers["Last-Modified"]
+
+        async with self.session.get(url, headers=headers) as r:
+            if r.status == 304 and cached:
+                self.validators.move_to_end(url)
+                self.validator_stats["hits"] += 1
+                return cached._replace(cached=True)
+
+            response = CachedResponse(
+                r.status,
+                await r.read(),
+                {k: r.headers[k] for k in VALIDATOR_HEADERS if k in r.headers},
+            )
+
+        self.validator_stats["misses"] += 1
+        if cached:
+            self.validator_bytes -= len(self.validators.pop(url).body)
+        if response.status == 200 and response.headers:
+            self.validators[url] = response
+            self.validator_bytes += len(response.body)
+            while self.validator_bytes > VALIDATOR_CACHE_BYTES:
+                _, evicted = self.validators.popitem(last=False)
+                self.validator_bytes -= len(evicted.body)
+        return response
+
+    @asynccontextmanager
+    async def google_request(
+        self,
+        credentials: GoogleCredentials,
+        method: str,
+        url: str | URL,
+        *,
+        params: list[tuple[str, str]] | None = None,
+        json: Any = None,
+        data: Callable[[], Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                token = await credentials.get_token(self.session)
+                r = await self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    data=data() if data else None,
+                    headers={**(headers or {}), "Authorization": f"Bearer {token}"},
+                )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == MAX_RETRIES:
+                    raise
+                await asyncio.sleep(self.google_backoff(attempt))
+                continue
+            except GoogleApiError as e:
+                # Raised by the token endpoint
+                if e.status not in GOOGLE_RETRY_STATUSES or attempt == MAX_RETRIES:
+                    raise
+                await asyncio.sleep(self.google_backoff(attempt))
+                continue
+
+            if r.ok:
+                break
+
+            async with r:
+                message = await r.text()
+            if r.status == 401:
+                credentials.invalidate()
+            if r.status not in GOOGLE_RETRY_STATUSES or attempt == MAX_RETRIES:
+                raise GoogleApiError(r.status, message)
+            await asyncio.sleep(self.google_backoff(attempt))
+
+        async with r:
+            yield r
+
+    async def google_json(
+        self,
+        credentials: GoogleCredentials,
+        method: str,
+        url: str | URL,
+        **kwargs: Any,
+    ) -> Any:
+        async with self.google_request(credentials, method, url, **kwargs) as r:
+            return await r.json(content_type=None)
+
+    async def google_batch(
+        self,
+        credentials: GoogleCredentials,
+        url: str,
+        requests: list[GoogleRequest],
+    ) -> list[Any]:
+        boundary = uuid4().hex
+        parts = []
+        for i, request in enumerate(requests):
+            target = URL(request.url).with_query(request.params or [])
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <{i}>\r\n\r\n"
+                f"{request.method} {target.raw_path_qs} HTTP/1.1\r\n"
+                "Content-Type: application/json\r\n\r\n"
+                f"{json.dumps(request.json) if request.json is not None else ''}\r\n"
+            )
+        parts.append(f"--{boundary}--\r\n")
+        body = "".join(parts).encode()
+
+        async with self.google_request(
+            credentials,
+            "POST",
+            url,
+            data=lambda: body,
+            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        ) as r:
+            message = BytesParser().parsebytes(
+                f"Content-Type: {r.headers['Content-Type']}\r\n\r\n".encode()
+                + await r.read()
+            )
+
+        results: list[Any] = [
+            GoogleApiError(0, "Missing batch response") for _ in requests
+        ]
+        if not message.is_multipart():
+            return [
+                GoogleApiError(r.status, "Batch response is not multipart")
+                for _ in requests
+            ]
+        for part in message.get_payload():
+            i = int(part["Content-ID"].strip("<>").rpartition("-")[2])
+            # Decode bytes so non-ASCII JSON survives transfer encodings
+            response = part.get_payload(decode=True).decode("utf-8")
+            response = response.replace("\r\n", "\n")
+            head, _, content = response.partition("\n\n")
+            status = int(head.split(None, 2)[1])
+            if 200 <= status < 300:
+                results[i] = json.loads(content) if content.strip() else {}
+            else:
+                results[i] = GoogleApiError(status, content.strip())
+        return results
+
+    @staticmethod
+    def google_backoff(attempt: int) -> float:
+        return min(GOOGLE_BACKOFF_MAX, 2**attempt) * random.random()
+
+    async def on_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        host = params.url.host or ""
+        delay = await self.buckets[host].acquire()
+        self.throttled[host] += delay
+
+
+async def setup(bot: "dBot") -> None:
+    await bot.add_cog(HttpClient(bot))
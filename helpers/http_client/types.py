@@ -0,0 +1,107 @@
+import asyncio
+import json
+import time
+from typing import Any, NamedTuple
+
+import aiohttp
+from google.auth import crypt, jwt
+from yarl import URL
+
+from .commons import GOOGLE_TOKEN_LIFETIME, GOOGLE_TOKEN_MARGIN
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+
+            delay = (1 - self.tokens) / self.rate
+            await asyncio.sleep(delay)
+            self.tokens = 0.0
+            self.updated = time.monotonic()
+            return delay
+
+
+class CachedResponse(NamedTuple):
+    status: int
+    body: bytes
+    headers: dict[str, str]
+    cached: bool = False
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class GoogleApiError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class GoogleRequest(NamedTuple):
+    method: str
+    url: URL
+    params: list[tuple[str, str]] | None = None
+    json: Any = None
+
+
+class GoogleCredentials:
+    def __init__(self, filename: str, scopes: list[str]) -> None:
+        with open(filename, "r", encoding="utf-8") as f:
+            info = json.load(f)
+        self.signer = crypt.RSASigner.from_service_account_info(info)
+        self.email = info["client_email"]
+        self.token_uri = info["token_uri"]
+        self.scopes = " ".join(scopes)
+        self.token = ""
+        self.expiry = 0.0
+        self.lock = asyncio.Lock()
+
+    async def get_token(self, session: aiohttp.ClientSession) -> str:
+        async with self.lock:
+            now = time.time()
+            if now < self.expiry - GOOGLE_TOKEN_MARGIN:
+                return self.token
+
+            assertion = jwt.encode(
+                self.signer,
+                {
+                    "iss": self.email,
+                    "scope": self.scopes,
+                    "aud": self.token_uri,
+                    "iat": int(now),
+                    "exp": int(now) + GOOGLE_TOKEN_LIFETIME,
+                },
+            )
+            async with session.post(
+                self.token_uri,
+                data={
+                    "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
+                    "assertion": assertion.decode(),
+                },
+            ) as r:
+                if not r.ok:
+                    raise GoogleApiError(r.status, await r.text())
+                result = await r.json()
+
+            self.token = result["access_token"]
+            self.expiry = now + result["expires_in"]
+            return self.token
+
+    def invalidate(self) -> None:
+        self.expiry = 0.0
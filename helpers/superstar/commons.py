@@ -1,4 +1,16 @@
+from pathlib import Path
+
 IV_LENGTH = 16
 ASSET_IGNORE = "true"
 API_VERSION = "8"
 APKPURE_URL = "https://d.apkpure.com/b/XAPK/{package_name}?version=latest"
+DECODE_WORKERS = 2
+EXTRACT_WORKERS = 4
+ASSET_CACHE_INDEX = Path("data/files/index.json")
+ASSET_CACHE_BUDGET = 4 * 1024**3  # 4 GiB
+ASSET_CACHE_GRACE = 900  # 15 minutes
+APK_CHUNK_SIZE = 1048576  # 1 MiB
+WORLD_RECORD_TTL = 300  # 5 minutes after Last-Modified
+WORLD_RECORD_MIN_TTL = 30  # seconds
+WORLD_RECORD_CONCURRENCY = 8
+WORLD_RECORD_CACHE_SIZE = 4096
@@ -4,10 +4,18 @@
 import asyncio
 import gzip
 import json
+import logging
+import multiprocessing
+import os
+import pickle
+import shutil
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
-from zipfile import ZipFile
+from typing import TYPE_CHECKING, Any, Literal
 
 import aiohttp
 import discord
@@ -20,17 +28,77 @@ from packaging.version import Version
 
 from statics.consts import CHUNK_SIZE, GAMES, STATUS_CHANNEL, TIMEZONES
 
+from .commons import (
+    ASSET_CACHE_BUDGET,
+    ASSET_CACHE_GRACE,
+    ASSET_CACHE_INDEX,
+    DECODE_WORKERS,
+    EXTRACT_WORKERS,
+    WORLD_RECORD_CACHE_SIZE,
+    WORLD_RECORD_CONCURRENCY,
+    WORLD_RECORD_MIN_TTL,
+    WORLD_RECORD_TTL,
+)
 from .embeds import SSLeagueEmbed as _SSLeagueEmbed
-from .types import SuperStarHeaders
+from .types import ApkReader, Catalog, SuperStarHeaders
 
 if TYPE_CHECKING:
     from dBot import dBot
     from helpers.cryptographic import Cryptographic
+    from helpers.http_client import HttpClient
 
 
 class SuperStar(commands.Cog):
+    LOGGER = logging.getLogger(__name__.rpartition(".")[0])
+
     def __init__(self, bot: "dBot") -> None:
         self.bot = bot
+        self.decode_executor = ProcessPoolExecutor(
+            max_workers=DECODE_WORKERS,
+            mp_context=multiprocessing.get_context(
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            ),
+        )
+        self.bundle_tasks: dict[tuple[str, str], asyncio.Task[bool]] = {}
+        self.extract_semaphore = asyncio.Semaphore(EXTRACT_WORKERS)
+        self.asset_lock = asyncio.Lock()
+        self.base_assets_apks: dict[str, asyncio.Task[Path | None]] = {}
+        self.apk_readers: dict[str, ApkReader] = {}
+        self.asset_index: dict[str, dict] = {}
+        if ASSET_CACHE_INDEX.exists():
+            with open(ASSET_CACHE_INDEX, "r", encoding="utf-8") as f:
+                self.asset_index = json.load(f)
+        self.world_records: OrderedDict[
+            tuple[str, int, int, bool], tuple[float, list[dict], datetime | None]
+        ] = OrderedDict()
+        self.world_record_tasks: dict[
+            tuple[str, int, int, bool],
+            asyncio.Task[tuple[list[dict], datetime | None]],
+        ] = {}
+        self.world_record_stats = {"hits": 0, "misses": 0}
+        self.decode_metrics = {
+            "files": 0,
+            "bytes_in": 0,
+            "decode_time": 0.0,
+            "queue_wait": 0.0,
+        }
+
+    @property
+    def http_client(self) -> "HttpClient":
+        return self.bot.get_cog("HttpClient")
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self.http_client.session
+
+    async def cog_unload(self) -> None:
+        self.decode_executor.shutdown(wait=False, cancel_futures=True)
+        self.save_asset_index()
+        self.clear_base_assets_apks()
+        for reader in self.apk_readers.values():
+            reader.close()
 
     async def get_manifest(self, game: str, version: str | None = None) -> dict:
         max_active_version = None
@@ -45,37 +113,35 @@ class SuperStar(commands.Cog):
                 if v is not None
             )
 
-        async with aiohttp.ClientSession() as session:
-            while True:
-                try:
-                    async with session.get(
-                        GAMES[game]["manifestUrl"].format(
-                            version=version or max_active_version
-                        )
-                    ) as r:
-                        manifest = await r.json(content_type=None)
-                        if manifest["ActiveVersion_Android"] == version:
-                            return manifest
-                        version = manifest["ActiveVersion_Android"]
-                except json.JSONDecodeError:
-                    version = GAMES[game]["lastVersion"]
+        while True:
+            try:
+                r = await self.http_client.get_conditional(
+                    GAMES[game]["manifestUrl"].format(
+                        version=version or max_active_version
+                    )
+                )
+                manifest = r.json()
+                if manifest["ActiveVersion_Android"] == version:
+                    return manifest
+                version = manifest["ActiveVersion_Android"]
+            except json.JSONDecodeError:
+                version = GAMES[game]["lastVersion"]
 
     async def get_a_json(self, game: str) -> dict:
         headers = SuperStarHeaders()
         iv = headers["X-SuperStar-AES-IV"]
         basic_details = self.bot.basic[game]
 
-        async with aiohttp.ClientSession() as session:
-            cog: "Cryptographic" = self.bot.get_cog("Cryptographic")
+        cog: "Cryptographic" = self.bot.get_cog("Cryptographic")
 
-            async with session.post(
-                url=basic_details["manifest"]["ServerUrl"],
-                headers=headers,
-                data=cog.encrypt_cbc(
-                    '{"class":"Platform","method":"checkAssetBundle","params":[0]}', iv
-                ),
-            ) as r:
-                ajs = await self.read_dalcom_json(r, iv)
+        async with self.session.post(
+            url=basic_details["manifest"]["ServerUrl"],
+            headers=headers,
+            data=cog.encrypt_cbc(
+                '{"class":"Platform","method":"checkAssetBundle","params":[0]}', iv
+            ),
+        ) as r:
+            ajs = await self.read_dalcom_json(r, iv)
         return ajs
 
     async def login_classic(self, game: str, credentials: dict) -> tuple[int, str]:
@@ -83,21 +149,20 @@ class SuperStar(commands.Cog):
         iv = headers["X-SuperStar-AES-IV"]
         basic_details = self.bot.basic[game]
 
-        async with aiohttp.ClientSession() as session:
-            cog: "Cryptographic" = self.bot.get_cog("Cryptographic")
+        cog: "Cryptographic" = self.bot.get_cog("Cryptographic")
 
-            async with session.post(
-                url=basic_details["manifest"]["ServerUrl"],
-                headers=headers,
-                data=cog.encrypt_cbc(
-                    credentials["account"].format(
-                        version=basic_details["manifest"]["ActiveVersion_Android"],
-                        **credentials,
-                    ),
-                    iv,
+        async with self.session.post(
+            url=basic_details["manifest"]["ServerUrl"],
+            headers=headers,
+            data=cog.encrypt_cbc(
+                credentials["account"].format(
+                    version=basic_details["manifest"]["ActiveVersion_Android"],
+                    **credentials,
                 ),
-            ) as r:
-                account = await self.read_dalcom_json(r, iv)
+                iv,
+            ),
+        ) as r:
+            account = await self.read_dalcom_json(r, iv)
 
         oid = account["result"]["user"]["objectID"]
         key = account["invoke"][0]["params"][0]
@@ -117,22 +182,21 @@ class SuperStar(commands.Cog):
         iv = headers["X-SuperStar-AES-IV"]
         basic_details = self.bot.basic[game]
 
-        async with aiohttp.ClientSession() as session:
-            cog: "Cryptographic" = self.bot.get_cog("Cryptographic")
+        cog: "Cryptographic" = self.bot.get_cog("Cryptographic")
 
-            async with session.post(
-                url=basic_details["manifest"]["ServerUrl"],
-                headers=headers,
-                data=cog.encrypt_cbc(
-                    credentials["account"].format(
-                        version=basic_details["manifest"]["ActiveVersion_Android"],
-                        id_token=id_token,
-                        **credentials,
-                    ),
-                    iv,
+        async with self.session.post(
+            url=basic_details["manifest"]["ServerUrl"],
+            headers=headers,
+            data=cog.encrypt_cbc(
+                credentials["account"].format(
+                    version=basic_details["manifest"]["ActiveVersion_Android"],
+                    id_token=id_token,
+                    **credentials,
                 ),
-            ) as r:
-                account = await self.read_dalcom_json(r, iv)
+                iv,
+            ),
+        ) as r:
+            account = await self.read_dalcom_json(r, iv)
 
         oid = account["result"]["user"]["objectID"]
         key = account["invoke"][0]["params"][0]
@@ -145,37 +209,36 @@ class SuperStar(commands.Cog):
         iv = headers["X-SuperStar-AES-IV"]
         basic_details = self.bot.basic[game]
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url="https://oauth.dalcomsoft.net/v1/token",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Basic {authorization}",
-                },
-                data=(
-                    f'{{"id":"{credentials["id"]}",'
-                    f'"pass":"{credentials["pass"]}",'
-                    f'"grant_type":"password"}}'
-                ),
-            ) as r:
-                dalcom_id = await r.json(content_type=None)
-                access_token = dalcom_id["data"]["access_token"]
+        async with self.session.post(
+            url="https://oauth.dalcomsoft.net/v1/token",
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Basic {authorization}",
+            },
+            data=(
+                f'{{"id":"{credentials["id"]}",'
+                f'"pass":"{credentials["pass"]}",'
+                f'"grant_type":"password"}}'
+            ),
+        ) as r:
+            dalcom_id = await r.json(content_type=None)
+            access_token = dalcom_id["data"]["access_token"]
 
-            cog: "Cryptographic" = self.bot.get_cog("Cryptographic")
+        cog: "Cryptographic" = self.bot.get_cog("Cryptographic")
 
-            async with session.post(
-                url=basic_details["manifest"]["ServerUrl"],
-                headers=headers,
-                data=cog.encrypt_cbc(
-                    credentials["account"].format(
-                        version=basic_details["manifest"]["ActiveVersion_Android"],
-                        access_token=access_token,
-                        **credentials,
-                    ),
-                    iv,
+        async with self.session.post(
+            url=basic_details["manifest"]["ServerUrl"],
+            headers=headers,
+            data=cog.encrypt_cbc(
+                credentials["account"].format(
+                    version=basic_details["manifest"]["ActiveVersion_Android"],
+                    access_token=access_token,
+                    **credentials,
                 ),
-            ) as r:
-                account = await self.read_dalcom_json(r, iv)
+                iv,
+            ),
+        ) as r:
+            account = await self.read_dalcom_json(r, iv)
 
         oid = account["result"]["user"]["objectID"]
         key = account["invoke"][0]["params"][0]
@@ -186,24 +249,96 @@ class SuperStar(commands.Cog):
         iv = headers["X-SuperStar-AES-IV"]
         basic_details = self.bot.basic[game]
 
-        async with aiohttp.ClientSession() as session:
-            cog: "Cryptographic" = self.bot.get_cog("Cryptographic")
+        cog: "Cryptographic" = self.bot.get_cog("Cryptographic")
 
-            async with session.post(
-                url=basic_details["manifest"]["ServerUrl"],
-                headers=headers,
-                data=cog.encrypt_cbc(
-                    f'{{"class":"StarLeague",'
-                    f'"method":"getWeekPlayMusic",'
-                    f'"params":[{oid},"{key}"]}}',
-                    iv,
-                ),
-            ) as r:
-                ssleague = await self.read_dalcom_json(r, iv)
+        async with self.session.post(
+            url=basic_details["manifest"]["ServerUrl"],
+            headers=headers,
+            data=cog.encrypt_cbc(
+                f'{{"class":"StarLeague",'
+                f'"method":"getWeekPlayMusic",'
+                f'"params":[{oid},"{key}"]}}',
+                iv,
+            ),
+        ) as r:
+            ssleague = await self.read_dalcom_json(r, iv)
         return ssleague
 
+    async def get_world_records(
+        self,
+        game: str,
+        season: int,
+        item_ids: list[int],
+        first_only: bool = False,
+        refresh: bool = False,
+    ) -> list[tuple[list[dict], datetime | None] | BaseException]:
+        semaphore = asyncio.Semaphore(WORLD_RECORD_CONCURRENCY)
+
+        async def get_world_record(item_id: int) -> tuple[list[dict], datetime | None]:
+            async with semaphore:
+                return await self.get_world_record(
+                    game, season, item_id, first_only, refresh
+                )
+
+        results = await asyncio.gather(
+            *(get_world_record(item_id) for item_id in item_ids),
+            return_exceptions=True,
+        )
+        hits, misses = (
+            self.world_record_stats["hits"],
+            self.world_record_stats["misses"],
+        )
+        self.LOGGER.info(
+            "World record cache: %d hits, %d misses (%.1f%% hit rate)",
+            hits,
+            misses,
+            hits / (hits + misses) * 100 if hits + misses else 0,
+        )
+        return results
+
     async def get_world_record(
-        self, game: str, season: int, item_id: int, first_only: bool = False
+        self,
+        game: str,
+        season: int,
+        item_id: int,
+        first_only: bool = False,
+        refresh: bool = False,
+    ) -> tuple[list[dict], datetime | None]:
+        key = (game, season, item_id, first_only)
+        if not refresh:
+            if (cached := self.world_records.get(key)) and (
+                time.monotonic() < cached[0]
+            ):
+                self.world_record_stats["hits"] += 1
+                return cached[1], cached[2]
+            self.world_record_stats["misses"] += 1
+
+        # Identical lookups in flight share one request
+        if not (task := self.world_record_tasks.get(key)):
+            task = self.world_record_tasks[key] = asyncio.create_task(
+                self.fetch_world_record(game, season, item_id, first_only)
+            )
+            task.add_done_callback(lambda _: self.world_record_tasks.pop(key, None))
+        world_record, last_modified = await asyncio.shield(task)
+
+        # Records expire a TTL after the server last updated them
+        ttl = WORLD_RECORD_TTL
+        if last_modified:
+            ttl = min(
+                max(
+                    last_modified.timestamp() + WORLD_RECORD_TTL - time.time(),
+                    WORLD_RECORD_MIN_TTL,
+                ),
+                WORLD_RECORD_TTL,
+            )
+        self.world_records[key] = (time.monotonic() + ttl, world_record, last_modified)
+        self.world_records.move_to_end(key)
+        while len(self.world_records) > WORLD_RECORD_CACHE_SIZE:
+            self.world_records.popitem(last=False)
+        return world_record, last_modified
+
+    async def fetch_world_record(
+        self, game: str, season: int, item_id: int, first_only: bool
     ) -> tuple[list[dict], datetime | None]:
         world_record_base = self.bot.basic[game]["manifest"]["MusicRankServerUrl"]
         world_record_latest = f"{world_record_base}{season}/{item_id}/latest.json"
@@ -211,33 +346,23 @@ class SuperStar(commands.Cog):
             f"{world_record_base}{season}/{item_id}/latest_first.json"
         )
 
-        async with aiohttp.ClientSession() as session:
-            if not first_only:
-                async with session.get(url=world_record_latest) as r:
-                    if r.status == 200:
-                        return await r.json(content_type=None), (
-                            datetime.strptime(
-                                r.headers["Last-Modified"],
-                                "%a, %d %b %Y %H:%M:%S %Z",
-                            )
-                            .replace(tzinfo=timezone.utc)
-                            .astimezone(tz=TIMEZONES[GAMES[game]["timezone"]])
-                            if "Last-Modified" in r.headers
-                            else None
-                        )
-
-            async with session.get(url=world_record_latest_first) as r:
-                if r.status == 200:
-                    return await r.json(content_type=None), (
-                        datetime.strptime(
-                            r.headers["Last-Modified"],
-                            "%a, %d %b %Y %H:%M:%S %Z",
-                        )
-                        .replace(tzinfo=timezone.utc)
-                        .astimezone(tz=TIMEZONES[GAMES[game]["timezone"]])
-                        if "Last-Modified" in r.headers
-                        else None
+        for url in (
+            (world_record_latest_first,)
+            if first_only
+            else (world_record_latest, world_record_latest_first)
+        ):
+            r = await self.http_client.get_conditional(url)
+            if r.status == 200:
+                return r.json(), (
+                    datetime.strptime(
+                        r.headers["Last-Modified"],
+                        "%a, %d %b %Y %H:%M:%S %Z",
                     )
+                    .replace(tzinfo=timezone.utc)
+                    .astimezone(tz=TIMEZONES[GAMES[game]["timezone"]])
+                    if "Last-Modified" in r.headers
+                    else None
+                )
 
         return [], None
 
@@ -252,15 +377,43 @@ class SuperStar(commands.Cog):
         return result
 
     async def get_data(self, url: str) -> dict[str, dict]:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url=url) as r:
-                content = await r.read()
+        async with self.session.get(url=url) as r:
+            content = await r.read()
 
         cog: "Cryptographic" = self.bot.get_cog("Cryptographic")
-        data = json.loads(
-            cog.decrypt_ecb(gzip.decompress(content)).replace(rb"\/", rb"/")
+        loop = asyncio.get_running_loop()
+        data, queue_wait, decode_time = await loop.run_in_executor(
+            self.decode_executor,
+            self.decode_data,
+            content,
+            cog.decrypt_ecb,
+            time.monotonic(),
+        )
+
+        self.decode_metrics["files"] += 1
+        self.decode_metrics["bytes_in"] += len(content)
+        self.decode_metrics["decode_time"] += decode_time
+        self.decode_metrics["queue_wait"] += queue_wait
+        self.LOGGER.info(
+            "Decoded %s (%d bytes): %.2fs decode, %.2fs queue wait",
+            url.rpartition("/")[2],
+            len(content),
+            decode_time,
+            queue_wait,
+        )
+        return data
+
+    @staticmethod
+    def decode_data(
+        content: bytes, decrypt: Callable[[bytes], bytes], submitted: float
+    ) -> tuple[dict[str, dict], float, float]:
+        started = time.monotonic()
+        data = json.loads(decrypt(gzip.decompress(content)).replace(rb"\/", rb"/"))
+        return (
+            {str(item["code"]): item for item in data},
+            started - submitted,
+            time.monotonic() - started,
         )
-        return {str(item["code"]): item for item in data}
 
     async def get_attributes(
         self,
@@ -280,95 +433,335 @@ class SuperStar(commands.Cog):
         item_ids: list[int],
         attributes: dict[str, bool],
     ) -> dict[int, dict]:
+        columns = await self.get_attributes_bulk(game, search, item_ids, attributes)
+        return {
+            item_id: {attribute: columns[attribute][i] for attribute in attributes}
+            for i, item_id in enumerate(item_ids)
+        }
+
+    async def get_attributes_bulk(
+        self,
+        game: str,
+        search: (
+            Literal[
+                "GroupData",
+                "LocaleData",
+                "MusicData",
+                "ThemeData",
+                "ThemeTypeData",
+                "SeqData",
+                "URLs",
+            ]
+            | tuple[dict[str, dict], dict[str, dict] | None]
+        ),
+        item_ids: list[int],
+        attributes: dict[str, bool],
+        extract: bool = True,
+    ) -> dict[str, list]:
         if isinstance(search, str):
-            with open(f"data/dalcom/{game}/{search}.json", "r", encoding="utf-8") as f:
-                data = json.load(f)
-            try:
-                with open(f"data/dalcom/{game}/URLs.json", "r", encoding="utf-8") as f:
-                    url_data = json.load(f)
-            except FileNotFoundError:
-                url_data = None
+            if (data := self.get_dalcom_table(game, search)) is None:
+                raise FileNotFoundError(f"data/dalcom/{game}/{search}.json")
+            url_data = self.get_dalcom_table(game, "URLs")
         else:
             data = search[0]
             url_data = search[1]
 
-        found_data = {}
-        for item_id in item_ids:
-            found_data[item_id] = {}
-            for attribute, is_file in attributes.items():
-                found_data[item_id][attribute] = data.get(str(item_id), {}).get(
-                    attribute
-                )
+        items = [data.get(str(item_id), {}) for item_id in item_ids]
+        columns: dict[str, list] = {}
+        bundle_cells: dict[str, list[tuple[str, int]]] = {}
+        for attribute, is_file in attributes.items():
+            column = [item.get(attribute) for item in items]
+            columns[attribute] = column
+            if not is_file:
+                continue
 
-                if not is_file:
-                    continue
-
-                if isinstance(found_data[item_id][attribute], int) and url_data:
-                    found_data[item_id][attribute] = url_data.get(
-                        str(found_data[item_id][attribute]), {}
-                    ).get("url")
-                elif "catalogUrl" in GAMES[game]:
-                    found_data[item_id][attribute] = (
-                        await self.extract_file_from_bundle(
-                            game, found_data[item_id][attribute]
-                        )
-                    )
+            for i, value in enumerate(column):
+                if isinstance(value, int) and url_data:
+                    column[i] = url_data.get(str(value), {}).get("url")
+                elif extract and value is not None and "catalogUrl" in GAMES[game]:
+                    bundle_cells.setdefault(value, []).append((attribute, i))
+
+        if bundle_cells:
+            file_paths = await self.extract_files_from_bundles(game, list(bundle_cells))
+            for catalog_key, cells in bundle_cells.items():
+                for attribute, i in cells:
+                    columns[attribute][i] = file_paths[catalog_key]
+
+        return columns
+
+    def get_dalcom_table(self, game: str, table: str) -> dict[str, dict] | None:
+        tables = self.bot.dalcom.setdefault(game, {})
+        if table not in tables:
+            try:
+                with open(
+                    f"data/dalcom/{game}/{table}.json", "r", encoding="utf-8"
+                ) as f:
+                    tables[table] = json.load(f)
+            except FileNotFoundError:
+                tables[table] = None
+        return tables[table]
+
+    def get_dalcom_file_sizes(self, game: str) -> dict[str, int]:
+        return {
+            table: os.path.getsize(f"data/dalcom/{game}/{table}.json")
+            for table, data in self.bot.dalcom.get(game, {}).items()
+            if data is not None and os.path.exists(f"data/dalcom/{game}/{table}.json")
+        }
+
+    async def load_catalog(
+        self, catalog_extracted_path: Path, previous: Catalog | None = None
+    ) -> Catalog:
+        catalog_pickle_path = catalog_extracted_path.with_suffix(".pickle")
+        if catalog_pickle_path.exists():
+            try:
+                with open(catalog_pickle_path, "rb") as f:
+                    return await asyncio.to_thread(pickle.load, f)
+            except (pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+                pass
+
+        resource_version = catalog_extracted_path.stem.removesuffix("_extracted")
+        with open(catalog_extracted_path, "r", encoding="utf-8") as f:
+            catalog = await asyncio.to_thread(
+                lambda: Catalog(json.load(f), resource_version, previous)
+            )
+        with open(catalog_pickle_path, "wb") as f:
+            pickle.dump(catalog, f, pickle.HIGHEST_PROTOCOL)
+
+        if catalog.previous_version:
+            self.LOGGER.info(
+                "Catalog %s -> %s: %d added, %d removed, %d changed",
+                catalog.previous_version,
+                resource_version,
+                len(catalog.added),
+                len(catalog.removed),
+                len(catalog.changed),
+            )
+        return catalog
+
+    async def extract_files_from_bundles(
+        self, game: str, catalog_keys: list[str]
+    ) -> dict[str, Path | None]:
+        file_paths: dict[str, Path | None] = {}
+        bundle_keys: dict[str, list[str]] = {}
+        for catalog_key in catalog_keys:
+            if catalog_key in file_paths:
+                continue
+
+            bundle_key, file_path = self.resolve_bundle_file(game, catalog_key)
+            file_paths[catalog_key] = file_path
+            if (game, bundle_key) in self.bundle_tasks or not (
+                await self.is_bundle_cached(game, bundle_key, file_path)
+            ):
+                bundle_keys.setdefault(bundle_key, []).append(catalog_key)
+
+        # New bundles are copied from the APK in one pass, inside their own tasks
+        new_keys = [
+            bundle_key
+            for bundle_key in bundle_keys
+            if (game, bundle_key) not in self.bundle_tasks
+        ]
+        copy_task = (
+            asyncio.create_task(self.copy_bundles_from_apk(game, new_keys))
+            if new_keys
+            else None
+        )
+        tasks = [
+            self.get_bundle_task(game, bundle_key, copy_task)
+            for bundle_key in bundle_keys
+        ]
+        results = await asyncio.gather(
+            *(asyncio.shield(task) for task in tasks), return_exceptions=True
+        )
+        for (bundle_key, keys), extracted in zip(bundle_keys.items(), results):
+            if isinstance(extracted, BaseException):
+                self.LOGGER.error(
+                    "Failed to extract %s/%s: %r", game, bundle_key, extracted
+                )
+            if extracted is not True:
+                file_paths.update(dict.fromkeys(keys))
 
-        return found_data
+        return file_paths
 
     async def extract_file_from_bundle(
         self,
         game: str,
         catalog_key: str,
     ) -> Path | None:
-        catalog = self.bot.basic[game]["catalog"]
-        file_extract_path = ""
-        while dependency := catalog[catalog_key]["dependency"]:
-            file_extract_path = catalog[catalog_key]["internalId"]
-            catalog_key = dependency
-
-        bundle_path = Path(f"data/files/{game}/{catalog_key}")
-        bundle_extract_path = bundle_path.with_suffix("")
-        bundle_extract_path.mkdir(parents=True, exist_ok=True)
-        bundle_url = catalog[catalog_key]["internalId"]
+        bundle_key, file_path = self.resolve_bundle_file(game, catalog_key)
+        # A bundle still being extracted may have only some of its files on disk
+        if (game, bundle_key) in self.bundle_tasks or not (
+            await self.is_bundle_cached(game, bundle_key, file_path)
+        ):
+            if not await self.extract_bundle(game, bundle_key):
+                return None
+        return file_path
 
+    def resolve_bundle_file(self, game: str, catalog_key: str) -> tuple[str, Path]:
+        catalog_key, file_extract_path = self.bot.basic[game]["catalog"].resolve(
+            catalog_key
+        )
+        bundle_extract_path = Path(f"data/files/{game}/{catalog_key}").with_suffix("")
         file_path = (
             bundle_extract_path / file_extract_path.replace(",", "_")
             if file_extract_path.startswith("Assets")
             # else bundle_extract_path / "Assets" / file_name.replace(",", "_")
             else bundle_extract_path / "Assets" / file_extract_path
         )
-
+        return catalog_key, file_path
+
+    async def is_bundle_cached(
+        self, game: str, bundle_key: str, file_path: Path
+    ) -> bool:
+        internal_id = self.bot.basic[game]["catalog"].internal_id(bundle_key)
+        entry = self.asset_index.get(f"{game}/{bundle_key}")
+        if entry and entry["internalId"] != internal_id:
+            return False
         if not file_path.exists():
-            if not bundle_path.exists():
-                if not bundle_url.startswith("http"):
-                    apk_path = await self.get_base_assets_apk(game)
-                    if not apk_path:
-                        channel = self.bot.get_channel(
-                            STATUS_CHANNEL
-                        ) or await self.bot.fetch_channel(STATUS_CHANNEL)
-                        assert isinstance(channel, discord.TextChannel)
-                        await channel.send(
-                            f"<@{self.bot.owner_id}> Built-in bundle: `{bundle_url}`"
-                        )
-                        return None
-
-                    apk_bundle_path = catalog[catalog_key]["internalId"].split(
-                        "/Android/"
-                    )[-1]
-                    with ZipFile(apk_path, "r") as apk:
-                        with apk.open(
-                            f"assets/aa/Android/{apk_bundle_path}", "r"
-                        ) as bundle_file:
-                            with open(bundle_path, "wb") as f:
-                                f.write(bundle_file.read())
-                else:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(bundle_url) as r:
-                            with open(bundle_path, "wb") as f:
-                                async for chunk in r.content.iter_chunked(CHUNK_SIZE):
-                                    f.write(chunk)
+            return False
+
+        if not entry:
+            bundle_extract_path = Path(f"data/files/{game}/{bundle_key}").with_suffix(
+                ""
+            )
+            entry = self.asset_index[f"{game}/{bundle_key}"] = {
+                "path": str(bundle_extract_path),
+                "internalId": internal_id,
+                "size": await asyncio.to_thread(
+                    self.get_folder_size, bundle_extract_path
+                ),
+            }
+        entry["accessed"] = time.time()
+        return True
+
+    async def record_bundle(
+        self, game: str, bundle_key: str, bundle_extract_path: Path
+    ) -> None:
+        size = await asyncio.to_thread(self.get_folder_size, bundle_extract_path)
+        async with self.asset_lock:
+            self.asset_index[f"{game}/{bundle_key}"] = {
+                "path": str(bundle_extract_path),
+                "internalId": self.bot.basic[game]["catalog"].internal_id(bundle_key),
+                "size": size,
+                "accessed": time.time(),
+            }
+            await self.evict_assets()
+
+    async def evict_assets(self) -> None:
+        total_size = sum(entry["size"] for entry in self.asset_index.values())
+        if total_size <= ASSET_CACHE_BUDGET:
+            return
+
+        # Recently used or in-flight bundles may still be read by their callers
+        grace_time = time.time() - ASSET_CACHE_GRACE
+        evicted = 0
+        for key, entry in sorted(
+            self.asset_index.items(), key=lambda item: item[1]["accessed"]
+        ):
+            if total_size <= ASSET_CACHE_BUDGET:
+                break
+            if (
+                entry["accessed"] > grace_time
+                or tuple(key.split("/", 1)) in self.bundle_tasks
+            ):
+                continue
+
+            await asyncio.to_thread(shutil.rmtree, entry["path"], True)
+            del self.asset_index[key]
+            total_size -= entry["size"]
+            evicted += 1
+
+        self.LOGGER.info(
+            "Asset cache: evicted %d bundles, %.1f MiB in use",
+            evicted,
+            total_size / 1048576,
+        )
+
+    def save_asset_index(self) -> None:
+        ASSET_CACHE_INDEX.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = ASSET_CACHE_INDEX.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.asset_index, f, separators=(",", ":"))
+        temp_path.replace(ASSET_CACHE_INDEX)
+
+    @staticmethod
+    def get_folder_size(path: Path) -> int:
+        return sum(
+            os.path.getsize(os.path.join(root, file))
+            for root, _, files in os.walk(path)
+            for file in files
+        )
+
+    async def extract_bundle(self, game: str, bundle_key: str) -> bool:
+        return await asyncio.shield(self.get_bundle_task(game, bundle_key))
 
+    def get_bundle_task(
+        self,
+        game: str,
+        bundle_key: str,
+        copy_task: asyncio.Task[None] | None = None,
+    ) -> asyncio.Task[bool]:
+        # Concurrent requests for the same bundle share a single extraction
+        if not (task := self.bundle_tasks.get((game, bundle_key))):
+            task = asyncio.create_task(
+                self.download_and_extract_bundle(game, bundle_key, copy_task)
+            )
+            self.bundle_tasks[(game, bundle_key)] = task
+            task.add_done_callback(
+                lambda _: self.bundle_tasks.pop((game, bundle_key), None)
+            )
+        return task
+
+    async def download_and_extract_bundle(
+        self,
+        game: str,
+        bundle_key: str,
+        copy_task: asyncio.Task[None] | None = None,
+    ) -> bool:
+        if copy_task:
+            try:
+                await asyncio.shield(copy_task)
+            except Exception as e:
+                self.LOGGER.warning("APK batch copy failed: %s: %s", game, e)
+
+        catalog = self.bot.basic[game]["catalog"]
+        bundle_path = Path(f"data/files/{game}/{bundle_key}")
+        bundle_extract_path = bundle_path.with_suffix("")
+        bundle_url = catalog.internal_id(bundle_key)
+
+        # Drop assets extracted from an older build of this bundle
+        entry = self.asset_index.get(f"{game}/{bundle_key}")
+        if entry and entry["internalId"] != bundle_url:
+            await asyncio.to_thread(shutil.rmtree, bundle_extract_path, True)
+        bundle_extract_path.mkdir(parents=True, exist_ok=True)
+
+        if not bundle_path.exists():
+            if not bundle_url.startswith("http"):
+                apk_reader = await self.get_apk_reader(game)
+                if not apk_reader:
+                    channel = self.bot.get_channel(
+                        STATUS_CHANNEL
+                    ) or await self.bot.fetch_channel(STATUS_CHANNEL)
+                    assert isinstance(channel, discord.TextChannel)
+                    await channel.send(
+                        f"<@{self.bot.owner_id}> Built-in bundle: `{bundle_url}`"
+                    )
+                    return False
+
+                await self.read_apk(
+                    apk_reader,
+                    apk_reader.extract,
+                    self.get_apk_member(bundle_url),
+                    bundle_path,
+                )
+            else:
+                temp_path = bundle_path.with_suffix(f"{bundle_path.suffix}.tmp")
+                async with self.session.get(bundle_url) as r:
+                    with open(temp_path, "wb") as f:
+                        async for chunk in r.content.iter_chunked(CHUNK_SIZE):
+                            f.write(chunk)
+                temp_path.replace(bundle_path)
+
+        async with self.extract_semaphore:
             process = await asyncio.create_subprocess_exec(
                 "utils/bundle",
                 str(bundle_path),
@@ -377,11 +770,74 @@ class SuperStar(commands.Cog):
                 stderr=asyncio.subprocess.PIPE,
             )
             await process.communicate()
-            bundle_path.unlink(missing_ok=True)
+        bundle_path.unlink(missing_ok=True)
+        await self.record_bundle(game, bundle_key, bundle_extract_path)
+        return True
 
-        return file_path
+    async def copy_bundles_from_apk(self, game: str, bundle_keys: list[str]) -> None:
+        catalog = self.bot.basic[game]["catalog"]
+        members = {
+            self.get_apk_member(catalog.internal_id(bundle_key)): bundle_path
+            for bundle_key in bundle_keys
+            if not catalog.internal_id(bundle_key).startswith("http")
+            and not (bundle_path := Path(f"data/files/{game}/{bundle_key}")).exists()
+        }
+        if not members or not (apk_reader := await self.get_apk_reader(game)):
+            return
+
+        Path(f"data/files/{game}").mkdir(parents=True, exist_ok=True)
+        await self.read_apk(apk_reader, apk_reader.extract_many, members)
+
+    @staticmethod
+    def get_apk_member(bundle_url: str) -> str:
+        return f"assets/aa/Android/{bundle_url.split('/Android/')[-1]}"
+
+    async def get_apk_reader(self, game: str) -> ApkReader | None:
+        apk_path = await self.get_base_assets_apk(game)
+        if not apk_path:
+            return None
+
+        apk_reader = self.apk_readers.get(game)
+        if not apk_reader or apk_reader.path != apk_path:
+            if apk_reader:
+                apk_reader.close()
+            apk_reader = self.apk_readers[game] = await asyncio.to_thread(
+                ApkReader, apk_path
+            )
+        return apk_reader
+
+    async def read_apk(
+        self, apk_reader: ApkReader, read: Callable[..., Any], *args: Any
+    ) -> Any:
+        # The reader stays open until the worker thread is done with it, even
+        # if the caller is cancelled first
+        apk_reader.acquire()
+        task = asyncio.create_task(asyncio.to_thread(read, *args))
+        task.add_done_callback(lambda _: apk_reader.release())
+        return await asyncio.shield(task)
+
+    def clear_base_assets_apks(self) -> None:
+        self.base_assets_apks.clear()
 
     async def get_base_assets_apk(self, game: str) -> Path | None:
+        # Google Play is only asked once per sync run for each game
+        if not (task := self.base_assets_apks.get(game)):
+            task = self.base_assets_apks[game] = asyncio.create_task(
+                self.download_base_assets_apk(game)
+            )
+            task.add_done_callback(lambda _: self.forget_base_assets_apk(game, task))
+        return await asyncio.shield(task)
+
+    def forget_base_assets_apk(
+        self, game: str, task: asyncio.Task[Path | None]
+    ) -> None:
+        # Failed lookups are retried by the next caller instead of memoized
+        if (
+            task.cancelled() or task.exception() or not task.result()
+        ) and self.base_assets_apks.get(game) is task:
+            del self.base_assets_apks[game]
+
+    async def download_base_assets_apk(self, game: str) -> Path | None:
         play_auth = await asyncio.to_thread(ensure_auth)
         if not play_auth:
             return None
@@ -406,11 +862,10 @@ class SuperStar(commands.Cog):
         )
         for apk in play_delivery.splits:
             if apk.name == "base_assets":
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(apk.url) as r:
-                        with open(apk_path, "wb") as f:
-                            async for chunk in r.content.iter_chunked(CHUNK_SIZE):
-                                f.write(chunk)
+                async with self.session.get(apk.url) as r:
+                    with open(apk_path, "wb") as f:
+                        async for chunk in r.content.iter_chunked(CHUNK_SIZE):
+                            f.write(chunk)
                 return apk_path
 
         return None
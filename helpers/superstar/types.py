@@ -1,7 +1,13 @@
 import random
+import shutil
 import string
+import sys
+from array import array
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from zipfile import ZipFile, ZipInfo
 
-from .commons import API_VERSION, ASSET_IGNORE, IV_LENGTH
+from .commons import API_VERSION, APK_CHUNK_SIZE, ASSET_IGNORE, IV_LENGTH
 
 
 class SuperStarHeaders(dict):
@@ -15,3 +21,141 @@ class SuperStarHeaders(dict):
                 "X-SuperStar-API-Version": API_VERSION,
             }
         )
+
+
+class ApkReader:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.zip_file = ZipFile(path, "r")
+        self.members: dict[str, ZipInfo] = {
+            info.filename: info for info in self.zip_file.infolist()
+        }
+        self.users = 0
+        self.closing = False
+
+    def __contains__(self, member: str) -> bool:
+        return member in self.members
+
+    def extract(self, member: str, dst: Path) -> None:
+        temp_path = dst.with_suffix(f"{dst.suffix}.tmp")
+        with self.zip_file.open(self.members[member], "r") as src_file:
+            with open(temp_path, "wb") as dst_file:
+                shutil.copyfileobj(src_file, dst_file, APK_CHUNK_SIZE)
+        temp_path.replace(dst)
+
+    def extract_many(self, members: dict[str, Path]) -> list[str]:
+        # Read members in archive order so the APK is scanned once front to back
+        extracted = []
+        for member in sorted(
+            (m for m in members if m in self.members),
+            key=lambda m: self.members[m].header_offset,
+        ):
+            self.extract(member, members[member])
+            extracted.append(member)
+        return extracted
+
+    def acquire(self) -> None:
+        self.users += 1
+
+    def release(self) -> None:
+        self.users -= 1
+        if self.closing and not self.users:
+            self.zip_file.close()
+
+    def close(self) -> None:
+        # Readers still in use are closed once their last extraction finishes
+        self.closing = True
+        if not self.users:
+            self.zip_file.close()
+
+
+class Catalog(Mapping[str, dict[str, str | None]]):
+    __slots__ = (
+        "keys_",
+        "index",
+        "internal_ids",
+        "dependencies",
+        "roots",
+        "paths",
+        "resource_version",
+        "previous_version",
+        "added",
+        "removed",
+        "changed",
+    )
+
+    def __init__(
+        self,
+        catalog: dict[str, dict[str, str | None]],
+        resource_version: str,
+        previous: "Catalog | None" = None,
+    ) -> None:
+        self.keys_ = [sys.intern(key) for key in catalog]
+        self.index = {key: i for i, key in enumerate(self.keys_)}
+        self.internal_ids = [entry["internalId"] or "" for entry in catalog.values()]
+        self.dependencies = array(
+            "i",
+            (
+                self.index[dependency] if (dependency := entry["dependency"]) else -1
+                for entry in catalog.values()
+            ),
+        )
+
+        # Root bundle and path inside it, as resolved by following dependencies
+        self.roots = array("i", [-1]) * len(self.keys_)
+        self.paths = [""] * len(self.keys_)
+        for i in range(len(self.keys_)):
+            chain = []
+            while self.roots[i] == -1 and self.dependencies[i] != -1:
+                chain.append(i)
+                i = self.dependencies[i]
+            if self.roots[i] == -1:
+                self.roots[i] = i
+
+            for j in reversed(chain):
+                dependency = self.dependencies[j]
+                self.roots[j] = self.roots[dependency]
+                self.paths[j] = (
+                    self.internal_ids[j]
+                    if self.roots[dependency] == dependency
+                    else self.paths[dependency]
+                )
+
+        self.resource_version = resource_version
+        self.previous_version: str | None = None
+        self.added: tuple[str, ...] = ()
+        self.removed: tuple[str, ...] = ()
+        self.changed: tuple[str, ...] = ()
+        if previous:
+            self.previous_version = previous.resource_version
+            self.added = tuple(key for key in self.keys_ if key not in previous)
+            self.removed = tuple(key for key in previous.keys_ if key not in self)
+            self.changed = tuple(
+                key
+                for key in self.keys_
+                if key in previous and self[key] != previous[key]
+            )
+
+    def __getitem__(self, key: str) -> dict[str, str | None]:
+        i = self.index[key]
+        dependency = self.dependencies[i]
+        return {
+            "internalId": self.internal_ids[i],
+            "dependency": self.keys_[dependency] if dependency != -1 else None,
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys_)
+
+    def __len__(self) -> int:
+        return len(self.keys_)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.index
+
+    def resolve(self, key: str) -> tuple[str, str]:
+        i = self.index[key]
+        return self.keys_[self.roots[i]], self.paths[i]
+
+    def internal_id(self, key: str) -> str:
+        return self.internal_ids[self.index[key]]
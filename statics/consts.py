@@ -37,6 +37,7 @@ STATIC_MODULES = (
 )
 
 EXTENSIONS = (
+    "helpers.http_client",
     "helpers.cryptographic",
     "helpers.google_sheets",
     "helpers.google_drive",
@@ -49,6 +50,7 @@ EXTENSIONS = (
     "tasks.notify_bonus",
     "tasks.pin_ssleague",
     "tasks.forward_update",
+    "tasks.prefetch_world_record",
     "app_commands.info",
     "app_commands.bonus",
     "app_commands.ping",
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, NotRequired, TypedDict
 if TYPE_CHECKING:
     from googleapiclient._apis.sheets.v4 import GridRange
 
+    from helpers.superstar.types import Catalog
+
 
 class SpreadsheetDetails(TypedDict):
     id: str
@@ -44,7 +46,7 @@ class GameDetails(TypedDict):
 class BasicDetails(TypedDict):
     iconUrl: str
     manifest: dict[str, str]
-    catalog: NotRequired[dict[str, dict[str, str]]]
+    catalog: NotRequired["Catalog"]
 
 
 class ArtistDetails(TypedDict):
@@ -47,108 +47,118 @@ class BasicSync(commands.Cog):
         self.LOGGER.info("Downloading basic data: %s...", game_details["name"])
         cog: "SuperStar" = self.bot.get_cog("SuperStar")  # type: ignore[assignment]
 
-        async with aiohttp.ClientSession() as session:
-            if {"iconUrl"} <= set(game_details):
-                # If game has been unlisted
-                version = game_details["lastVersion"]
-                iconUrl = game_details["iconUrl"]
-            else:
-                # Get latest version from Google Play
-                android_version = None
-                if self.play_auth:
-                    play_details = await asyncio.to_thread(
-                        get_details, game_details["packageName"], self.play_auth
-                    )
-                    android_version = play_details.version_string
-
-                # Get latest version and icon from iTunes
-                query = game_details.get("lookupQuery")
-                while True:
-                    try:
-                        async with session.get(
-                            f"https://itunes.apple.com/lookup?{query}"
-                        ) as r:
-                            weird_result = await r.text()
-                            text_result = weird_result.replace("\n", "")
-                            json_result = json.loads(text_result)
-                            ios_version = json_result["results"][0]["version"]
-                            iconUrl = json_result["results"][0]["artworkUrl100"]
-                            break
-                    except aiohttp.ClientConnectorError:
-                        self.LOGGER.exception("?")
-                        continue
-
-                version = str(
-                    max(
-                        Version(v)
-                        for v in [
-                            android_version,
-                            ios_version,
-                            game_details["lastVersion"],
-                        ]
-                        if v is not None
-                    )
+        if {"iconUrl"} <= set(game_details):
+            # If game has been unlisted
+            version = game_details["lastVersion"]
+            iconUrl = game_details["iconUrl"]
+        else:
+            # Get latest version from Google Play
+            android_version = None
+            if self.play_auth:
+                play_details = await asyncio.to_thread(
+                    get_details, game_details["packageName"], self.play_auth
+                )
+                android_version = play_details.version_string
+
+            # Get latest version and icon from iTunes
+            query = game_details.get("lookupQuery")
+            while True:
+                try:
+                    async with cog.session.get(
+                        f"https://itunes.apple.com/lookup?{query}"
+                    ) as r:
+                        weird_result = await r.text()
+                        text_result = weird_result.replace("\n", "")
+                        json_result = json.loads(text_result)
+                        ios_version = json_result["results"][0]["version"]
+                        iconUrl = json_result["results"][0]["artworkUrl100"]
+                        break
+                except aiohttp.ClientConnectorError:
+                    self.LOGGER.exception("?")
+                    continue
+
+            version = str(
+                max(
+                    Version(v)
+                    for v in [
+                        android_version,
+                        ios_version,
+                        game_details["lastVersion"],
+                    ]
+                    if v is not None
                 )
-
-            # Get manifest
-            manifest = await cog.get_manifest(game, version)
-            self.bot.basic[game] = BasicDetails(
-                iconUrl=iconUrl,
-                manifest=manifest,
-            )
-            if not (catalog_url := game_details.get("catalogUrl")):
-                return
-
-            # Get Unity Addressables Catalog
-            resource_version = manifest["ResourceVersion"]
-            catalog_folder_path = Path(f"data/catalogs/{game}")
-            catalog_folder_path.mkdir(parents=True, exist_ok=True)
-            extension = "bin" if catalog_url.endswith("bin") else "json"
-            catalog_packaged_path = (
-                catalog_folder_path / f"{resource_version}.{extension}"
-            )
-            catalog_extracted_path = (
-                catalog_folder_path / f"{resource_version}_extracted.json"
             )
 
-            if not catalog_extracted_path.exists():
-                for file in catalog_folder_path.iterdir():
-                    if file.is_file():
-                        file.unlink()
-                while True:
-                    async with session.get(
-                        catalog_url.format(version=resource_version)
-                    ) as r:
-                        if r.status == 403:
-                            resource_version = str(int(resource_version) - 1)
-                            catalog_packaged_path = (
-                                catalog_folder_path / f"{resource_version}.{extension}"
-                            )
-                            catalog_extracted_path = (
-                                catalog_folder_path
-                                / f"{resource_version}_extracted.json"
-                            )
-                            continue
-                        with open(catalog_packaged_path, "wb") as f:
-                            f.write(await r.read())
-
-                    # Convert catalog to readable format
-                    process = await asyncio.create_subprocess_exec(
-                        f"utils/catalog-{extension}",
-                        str(catalog_packaged_path),
-                        str(catalog_extracted_path),
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                    )
-                    await process.communicate()
-
-                    with open(catalog_extracted_path, "r", encoding="utf-8") as f:
-                        self.bot.basic[game]["catalog"] = json.load(f)
+        # Get manifest
+        manifest = await cog.get_manifest(game, version)
+        previous_catalog = self.bot.basic.get(game, {}).get("catalog")
+        self.bot.basic[game] = BasicDetails(
+            iconUrl=iconUrl,
+            manifest=manifest,
+        )
+        if not (catalog_url := game_details.get("catalogUrl")):
+            return
+
+        # Get Unity Addressables Catalog
+        resource_version = manifest["ResourceVersion"]
+        catalog_folder_path = Path(f"data/catalogs/{game}")
+        catalog_folder_path.mkdir(parents=True, exist_ok=True)
+        extension = "bin" if catalog_url.endswith("bin") else "json"
+        catalog_packaged_path = catalog_folder_path / f"{resource_version}.{extension}"
+        catalog_extracted_path = (
+            catalog_folder_path / f"{resource_version}_extracted.json"
+        )
+
+        if not catalog_extracted_path.exists():
+            # Keep the outgoing catalog around to diff the new one against
+            if not previous_catalog:
+                for file in catalog_folder_path.glob("*_extracted.json"):
+                    previous_catalog = await cog.load_catalog(file)
                     break
+            for file in catalog_folder_path.iterdir():
+                if file.is_file():
+                    file.unlink()
+            while True:
+                async with cog.session.get(
+                    catalog_url.format(version=resource_version)
+                ) as r:
+                    if r.status == 403:
+                        resource_version = str(int(resource_version) - 1)
+                        catalog_packaged_path = (
+                            catalog_folder_path / f"{resource_version}.{extension}"
+                        )
+                        catalog_extracted_path = (
+                            catalog_folder_path / f"{resource_version}_extracted.json"
+                        )
+                        continue
+                    with open(catalog_packaged_path, "wb") as f:
+                        f.write(await r.read())
+
+                # Convert catalog to readable format
+                process = await asyncio.create_subprocess_exec(
+                    f"utils/catalog-{extension}",
+                    str(catalog_packaged_path),
+                    str(catalog_extracted_path),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                await process.communicate()
+
+                self.bot.basic[game]["catalog"] = await cog.load_catalog(
+                    catalog_extracted_path, previous_catalog
+                )
+                break
 
         if "catalog" not in self.bot.basic[game]:
-            with open(catalog_extracted_path, "r", encoding="utf-8") as f:
-                self.bot.basic[game]["catalog"] = json.load(f)
+            if (
+                previous_catalog
+                and previous_catalog.resource_version == resource_version
+            ):
+                self.bot.basic[game]["catalog"] = previous_catalog
+            else:
+                self.bot.basic[game]["catalog"] = await cog.load_catalog(
+                    catalog_extracted_path
+                )
 
 
 async def setup(bot: "dBot") -> None:
@@ -1,6 +1,12 @@
+from pathlib import Path
+
 BORDER_FOLDER = "1FgZltBhxE0G2R93VnEhtNqSC_HtOmA-g"
 FOLDER_MIME = "application/vnd.google-apps.folder"
 BORDER_CHANNEL = 1420456673964982372
+BORDER_MANIFEST = Path("data/dalcom/borders.json")
+BORDER_QUEUE_SIZE = 8
+BORDER_EXTRACT_WORKERS = 4
+BORDER_UPLOAD_WORKERS = 2
 
 SEQ_PADDING = {
     0x65: 0,
@@ -13,3 +19,23 @@ SEQ_LANES = {
     0x71: range(13),
     0x7D: range(25),
 }
+
+GAME_CONCURRENCY = 4
+GAME_TIMEOUT = 2700  # 45 minutes
+
+DATA_FILES = (
+    "ArtistData",
+    "GroupData",
+    "HiddenGameData",
+    "LiveThemeData",
+    "LocaleData",
+    "MusicData",
+    "ThemeData",
+    "SeqData",
+    "ThemeTypeData",
+    "URLs",
+    "WorldRecordData",
+)
+ARTIST_INDEX_FILES = ("ArtistData", "GroupData", "LiveThemeData", "MusicData")
+SEQ_CACHE = Path("data/MusicData/seq_cache.json")
+OGG_TAIL_SIZE = 65536
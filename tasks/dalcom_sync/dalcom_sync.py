@@ -1,18 +1,21 @@
 # mypy: disable-error-code="assignment, import-untyped"
 # pyright: reportAssignmentType=false, reportTypedDictNotRequiredAccess=false
 
+import asyncio
 import binascii
+import hashlib
 import json
 import logging
 import math
 import re
 import shutil
 from collections import defaultdict
+from collections.abc import Iterable
 from datetime import datetime, time
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING
 
-import aiohttp
 import discord
 import soundfile
 from discord.ext import commands, tasks
@@ -20,11 +23,24 @@ from googleapiclient.http import MediaFileUpload
 
 from statics.consts import GAMES, TIMEZONES
 
-from .commons import BORDER_CHANNEL, BORDER_FOLDER, FOLDER_MIME
-from .types import Seq
+from .commons import (
+    ARTIST_INDEX_FILES,
+    BORDER_CHANNEL,
+    BORDER_EXTRACT_WORKERS,
+    BORDER_FOLDER,
+    BORDER_MANIFEST,
+    BORDER_QUEUE_SIZE,
+    BORDER_UPLOAD_WORKERS,
+    DATA_FILES,
+    FOLDER_MIME,
+    GAME_CONCURRENCY,
+    GAME_TIMEOUT,
+    SEQ_CACHE,
+)
+from .types import ArtistIndex, LazySeq, MusicInfoStore, Ogg, SeqSummary
 
 if TYPE_CHECKING:
-    from googleapiclient._apis.drive.v3 import File
+    from googleapiclient._apis.drive.v3 import File, FileList
 
     from dBot import dBot
     from helpers.google_drive import GoogleDrive
@@ -37,6 +53,34 @@ class DalcomSync(commands.Cog):
 
     def __init__(self, bot: "dBot") -> None:
         self.bot = bot
+        self.artist_indexes: dict[str, tuple[tuple, ArtistIndex]] = {}
+        self.seq_cache: dict[str, SeqSummary] = {}
+        self.seq_cache_stats = {"hits": 0, "misses": 0}
+        self.seq_digests: dict[str, str] = {}
+        self.catalog_states: dict[str, tuple[str, dict[str, str], tuple[str, ...]]] = {}
+        self.fingerprints: dict[str, str] = {}
+        self.sheet_updates: list[tuple[str, str, str, list[list[str]]]] = []
+        self.music_info_stores: dict[str, MusicInfoStore] = {}
+        self.theme_indexes: dict[str, tuple[str | None, dict[int, dict]]] = {}
+        self.border_manifest: dict[str, dict] = {}
+        if BORDER_MANIFEST.exists():
+            with open(BORDER_MANIFEST, "r", encoding="utf-8") as f:
+                self.border_manifest = json.load(f)
+        self.catalog_patterns = {
+            game: (
+                re.compile(game_details["catalogPattern"]["seq"]),
+                re.compile(game_details["catalogPattern"]["border"]),
+            )
+            for game, game_details in GAMES.items()
+            if "catalogPattern" in game_details
+        }
+        if SEQ_CACHE.exists():
+            with open(SEQ_CACHE, "r", encoding="utf-8") as f:
+                seq_cache = json.load(f)
+            # Older caches have no chart index and are rebuilt
+            if "summaries" in seq_cache:
+                self.seq_digests = seq_cache["digests"]
+                self.seq_cache = seq_cache["summaries"]
 
     async def cog_load(self) -> None:
         await self.dalcom_sync()
@@ -48,8 +92,6 @@ class DalcomSync(commands.Cog):
     @tasks.loop(time=[time(hour=h, minute=15) for h in range(24)])
     async def dalcom_sync(self) -> None:
         drive_cog: "GoogleDrive" = self.bot.get_cog("GoogleDrive")
-        sheets_cog: "GoogleSheets" = self.bot.get_cog("GoogleSheets")
-        ss_cog: "SuperStar" = self.bot.get_cog("SuperStar")
         border_channel = self.bot.get_channel(
             BORDER_CHANNEL
         ) or await self.bot.fetch_channel(BORDER_CHANNEL)
@@ -58,702 +100,1040 @@ class DalcomSync(commands.Cog):
             BORDER_FOLDER, mime_type=FOLDER_MIME
         )
 
-        for game, game_details in GAMES.items():
-            self.LOGGER.info("Downloading Dalcom data: %s...", game_details["name"])
+        ss_cog: "SuperStar" = self.bot.get_cog("SuperStar")
+        ss_cog.clear_base_assets_apks()
+
+        self.seq_cache_stats = {"hits": 0, "misses": 0}
+        self.sheet_updates.clear()
+        semaphore = asyncio.Semaphore(GAME_CONCURRENCY)
+        timings: dict[str, float] = {}
+        await asyncio.gather(
+            *(
+                self.run_game_sync(
+                    game, semaphore, timings, drive_folders, border_channel
+                )
+                for game in GAMES
+            )
+        )
+        await self.flush_sheet_updates()
+
+        if timings:
+            slowest = max(timings, key=timings.__getitem__)
+            self.LOGGER.info(
+                "Dalcom sync finished. Slowest: %s (%.2fs)",
+                GAMES[slowest]["name"],
+                timings[slowest],
+            )
+
+        self.LOGGER.info(
+            "Seq cache: %d hits, %d misses",
+            self.seq_cache_stats["hits"],
+            self.seq_cache_stats["misses"],
+        )
+        # Summaries of overwritten charts are dropped so the cache stays bounded
+        stale = self.seq_cache.keys() - set(self.seq_digests.values())
+        for digest in stale:
+            del self.seq_cache[digest]
+        if self.seq_cache_stats["misses"] or stale:
+            self.save_seq_cache()
 
-            bundle_folders: set[Path] = set()
-            missing_music = []
-            borders = {}
+        async with ss_cog.asset_lock:
+            ss_cog.save_asset_index()
 
-            music_info_file = Path(f"data/MusicData/{game}.json")
-            if not self.bot.info_from_file.get(game):
-                if music_info_file.exists():
-                    with open(music_info_file, "r", encoding="utf-8") as f:
-                        self.bot.info_from_file[game] = json.load(f)
-                else:
-                    self.bot.info_from_file[game] = {}
+    async def flush_sheet_updates(self) -> None:
+        if not self.sheet_updates:
+            return
 
-            if "catalogPattern" in game_details:
-                artist_name_index = game_details["spreadsheet"]["columns"][0].index(
-                    "artist_name"
+        sheets_cog: "GoogleSheets" = self.bot.get_cog("GoogleSheets")
+        try:
+            errors = await sheets_cog.batch_update_sheet_data(
+                [update[1:] for update in self.sheet_updates]
+            )
+        except Exception as e:
+            self.LOGGER.exception(str(e))
+            for game, _, _, _ in self.sheet_updates:
+                self.fingerprints.pop(game, None)
+            self.sheet_updates.clear()
+            return
+
+        for (game, _, range_str, _), error in zip(self.sheet_updates, errors):
+            if error is None:
+                continue
+            self.LOGGER.error(
+                "Failed to update %s (%s): %s", GAMES[game]["name"], range_str, error
+            )
+            self.fingerprints.pop(game, None)
+        self.sheet_updates.clear()
+
+    async def run_game_sync(
+        self,
+        game: str,
+        semaphore: asyncio.Semaphore,
+        timings: dict[str, float],
+        drive_folders: "FileList",
+        border_channel: discord.TextChannel,
+    ) -> None:
+        game_details = GAMES[game]
+        async with semaphore:
+            start = perf_counter()
+            timeout = asyncio.timeout(GAME_TIMEOUT)
+            try:
+                async with timeout:
+                    await self.sync_game(game, drive_folders, border_channel)
+            except TimeoutError as e:
+                # Timeouts raised inside the sync are ordinary failures
+                if not timeout.expired():
+                    self.LOGGER.exception(str(e))
+                else:
+                    self.LOGGER.warning(
+                        "Dalcom sync timed out: %s. Skipping...", game_details["name"]
+                    )
+            except Exception as e:
+                self.LOGGER.exception(str(e))
+            finally:
+                timings[game] = perf_counter() - start
+                self.LOGGER.info(
+                    "Dalcom data synced: %s (%.2fs)",
+                    game_details["name"],
+                    timings[game],
                 )
-                artist = {}
-                for song in self.bot.info_by_id[game].values():
-                    artist_name = song[artist_name_index]
-                    if artist_name in artist:
-                        continue
 
-                    artist[artist_name] = {
-                        "code": None,
-                        "emblem": None,
-                        "count": 0,
-                        "score": 0,
-                    }
+    async def sync_game(
+        self,
+        game: str,
+        drive_folders: "FileList",
+        border_channel: discord.TextChannel,
+    ) -> None:
+        game_details = GAMES[game]
+        ss_cog: "SuperStar" = self.bot.get_cog("SuperStar")
 
-                self.bot.artist[game] = artist
-                self.bot.live_theme[game]["max"] = 0
-
-                for k, v in self.bot.basic[game]["catalog"].items():
-                    if match := re.fullmatch(game_details["catalogPattern"]["seq"], k):
-                        song_id = match.group(1)
-                        difficulty = match.group(2).capitalize()
-                        dependency = (
-                            self.bot.info_from_file[game]
-                            .setdefault(song_id, {})
-                            .setdefault("seq", {})
-                            .setdefault(difficulty, {})
-                            .get("dependency")
-                        )
-                        if (
-                            song_id in self.bot.info_from_file[game]
-                            and difficulty
-                            in self.bot.info_from_file[game][song_id].get("seq", {})
-                            and dependency == v["dependency"]
-                        ):
-                            continue
-
-                        src_path = await ss_cog.extract_file_from_bundle(game, k)
-                        if not src_path:
-                            continue
-                        dst_path = Path(
-                            f"data/MusicData/{game}/{song_id}_{difficulty}.seq"
-                        )
-                        await self.copy_file(src_path, dst_path, bundle_folders)
-
-                        seq_obj = Seq(dst_path)
-                        self.bot.info_from_file[game][song_id]["seq"][difficulty] = {
-                            "count": seq_obj.count,
-                            "duration": seq_obj.SEQData_Info["secLength"],
-                            "key": k,
-                            "dependency": v["dependency"],
-                        }
-
-                        if song_id not in self.bot.info_by_id[game]:
-                            missing_music.append(
-                                [
-                                    song_id,
-                                    str(seq_obj.SEQData_Object),
-                                ]
-                            )
-                        self.bot.info_from_file[game][song_id].pop("duration", None)
-                    elif match := re.fullmatch(
-                        game_details["catalogPattern"]["border"], k
-                    ):
-                        border_id = match.group(1)
-                        border_internal = Path(v["internalId"])
-                        border_name = f"{border_id}{border_internal.suffix}"
-                        borders[border_name] = k
+        self.LOGGER.info("Downloading Dalcom data: %s...", game_details["name"])
+
+        missing_music = []
+        borders = {}
+
+        if not (music_info_store := self.music_info_stores.get(game)):
+            music_info_store = self.music_info_stores[game] = MusicInfoStore(
+                Path(f"data/MusicData/{game}.json")
+            )
+            if self.bot.info_from_file.get(game):
+                music_info_store.track(self.bot.info_from_file[game])
+        if not self.bot.info_from_file.get(game):
+            self.bot.info_from_file[game] = music_info_store.load()
+
+        if "catalogPattern" in game_details:
+            fingerprint = self.fingerprint_game(game, drive_folders)
+            if self.fingerprints.get(game) == fingerprint and not (
+                self.catalog_states.get(game, ("", {}, ()))[2]
+            ):
+                self.LOGGER.info(
+                    "Dalcom data unchanged: %s. Skipping...", game_details["name"]
+                )
+                return
+
+            artist_name_index = game_details["spreadsheet"]["columns"][0].index(
+                "artist_name"
+            )
+            artist = {}
+            for song in self.bot.info_by_id[game].values():
+                artist_name = song[artist_name_index]
+                if artist_name in artist:
+                    continue
 
-                for song_id in self.bot.info_from_file[game]:
-                    if "duration" in self.bot.info_from_file[game][song_id]:
-                        continue
+                artist[artist_name] = {
+                    "code": None,
+                    "emblem": None,
+                    "count": 0,
+                    "score": 0,
+                }
+
+            self.bot.artist[game] = artist
+            self.bot.live_theme[game]["max"] = 0
+
+            # Only keys added or changed since the last processed catalog
+            catalog = self.bot.basic[game]["catalog"]
+            catalog_state = self.catalog_states.get(game)
+            if catalog_state and catalog_state[0] == catalog.resource_version:
+                catalog_keys: Iterable[str] = catalog_state[2]
+                borders = dict(catalog_state[1])
+            elif catalog_state and catalog_state[0] == catalog.previous_version:
+                catalog_keys = catalog_state[2] + catalog.added + catalog.changed
+                stale_keys = set(catalog.removed) | set(catalog.changed)
+                borders = {
+                    border_name: k
+                    for border_name, k in catalog_state[1].items()
+                    if k not in stale_keys
+                }
+            else:
+                catalog_keys = catalog
+
+            seq_pattern, border_pattern = self.catalog_patterns[game]
+            pending_keys: list[str] = []
+            for k in catalog_keys:
+                if k not in catalog:
+                    continue
 
-                    duration = min(
-                        self.bot.info_from_file[game][song_id]["seq"][difficulty][
-                            "duration"
-                        ]
-                        for difficulty in self.bot.info_from_file[game][song_id]["seq"]
+                v = catalog[k]
+                if match := seq_pattern.fullmatch(k):
+                    song_id = match.group(1)
+                    difficulty = match.group(2).capitalize()
+                    dependency = (
+                        self.bot.info_from_file[game]
+                        .setdefault(song_id, {})
+                        .setdefault("seq", {})
+                        .setdefault(difficulty, {})
+                        .get("dependency")
                     )
-                    duration = math.floor(duration + 0.5)
-                    minutes = duration // 60
-                    seconds = str(duration % 60).zfill(2)
-                    self.bot.info_from_file[game][song_id][
-                        "duration"
-                    ] = f"{minutes}:{seconds}"
+                    if (
+                        song_id in self.bot.info_from_file[game]
+                        and difficulty
+                        in self.bot.info_from_file[game][song_id].get("seq", {})
+                        and dependency == v["dependency"]
+                    ):
+                        continue
 
-                with open(music_info_file, "w", encoding="utf-8") as f:
-                    json.dump(self.bot.info_from_file[game], f, indent=4)
+                    src_path = await ss_cog.extract_file_from_bundle(game, k)
+                    if not src_path:
+                        pending_keys.append(k)
+                        continue
+                    dst_path = Path(f"data/MusicData/{game}/{song_id}_{difficulty}.seq")
+                    await self.copy_file(src_path, dst_path)
+
+                    seq_summary = self.parse_seq(dst_path)
+                    self.bot.info_from_file[game][song_id]["seq"][difficulty] = {
+                        "count": seq_summary["count"],
+                        "duration": seq_summary["secLength"],
+                        "key": k,
+                        "dependency": v["dependency"],
+                    }
 
-                for path in bundle_folders:
-                    shutil.rmtree(path)
+                    if song_id not in self.bot.info_by_id[game]:
+                        missing_music.append(
+                            [
+                                song_id,
+                                str(self.get_seq_objects(dst_path)),
+                            ]
+                        )
+                    self.bot.info_from_file[game][song_id].pop("duration", None)
+                elif match := border_pattern.fullmatch(k):
+                    border_id = match.group(1)
+                    border_internal = Path(v["internalId"])
+                    border_name = f"{border_id}{border_internal.suffix}"
+                    borders[border_name] = k
+            self.catalog_states[game] = (
+                catalog.resource_version,
+                dict(borders),
+                tuple(pending_keys),
+            )
+
+            for song_id in self.bot.info_from_file[game]:
+                if "duration" in self.bot.info_from_file[game][song_id]:
+                    continue
 
-                missing_music.append(["-", "-"])
-                await sheets_cog.update_sheet_data(
+                duration = min(
+                    self.bot.info_from_file[game][song_id]["seq"][difficulty][
+                        "duration"
+                    ]
+                    for difficulty in self.bot.info_from_file[game][song_id]["seq"]
+                )
+                duration = math.floor(duration + 0.5)
+                minutes = duration // 60
+                seconds = str(duration % 60).zfill(2)
+                self.bot.info_from_file[game][song_id][
+                    "duration"
+                ] = f"{minutes}:{seconds}"
+
+            self.save_music_info(game, music_info_store)
+
+            missing_music.append(["-", "-"])
+            self.sheet_updates.append(
+                (
+                    game,
                     game_details["spreadsheet"]["id"],
                     game_details["spreadsheet"]["ranges"][0].partition("!")[0]
                     + "!Y2:Z",
                     missing_music,
                 )
+            )
+
+            if await self.sync_borders(
+                game, borders, drive_folders, border_channel, find_png=True
+            ):
+                self.fingerprints[game] = self.fingerprint_game(game, drive_folders)
+            return
+
+        try:
+            ajs_path = Path(f"data/dalcom/{game}/a.json")
+            if ajs_path.exists():
+                with open(ajs_path, "r", encoding="utf-8-sig") as f:
+                    stored_ajs = json.load(f)
+            else:
+                stored_ajs = defaultdict(lambda: defaultdict(dict))
+
+            if "iconUrl" in game_details:
+                ajs = {"code": 1000, "result": stored_ajs}
+                stored_ajs = ajs
+            else:
+                ajs = await ss_cog.get_a_json(game)
+
+            refresh = False
+            if ajs["code"] != 1000:
+                ajs = stored_ajs
+            elif (
+                not stored_ajs
+                or ajs["result"]["version"] != stored_ajs["result"]["version"]
+            ):
+                refresh = True
+            if not ajs:
+                return
+
+            fingerprint = self.fingerprint_game(game, drive_folders, ajs)
+            if self.fingerprints.get(game) == fingerprint:
+                self.LOGGER.info(
+                    "Dalcom data unchanged: %s. Skipping...", game_details["name"]
+                )
+                self.update_world_record_seasons(
+                    game, self.bot.dalcom[game]  # type: ignore[arg-type]
+                )
+                return
+
+            dalcom_data = await self.fetch_dalcom_data(game, ajs, stored_ajs)
+            pending_keys: list[str] = []
+
+            if refresh:
+                ajs_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(ajs_path, "w", encoding="utf-8") as f:
+                    json.dump(ajs, f, indent=4)
+
+            # Check if game has Live Theme Collection Reward
+            max_live = None
+            if "LiveThemeData" in dalcom_data and "collectRewardID" in next(
+                iter(dalcom_data["LiveThemeData"].values())
+            ):
+                max_live = 0
+
+            artist_name_index = game_details["spreadsheet"]["columns"][0].index(
+                "artist_name"
+            )
+            artist_index = self.get_artist_index(game, ajs, dalcom_data)
+            artist_songs: dict[str, str] = {}
+            for song_id, song in self.bot.info_by_id[game].items():
+                artist_songs.setdefault(song[artist_name_index], song_id)
+            artist_codes = [
+                artist_index["songs"].get(song_id) for song_id in artist_songs.values()
+            ]
+
+            # Get artist emblems
+            emblems = (
+                await ss_cog.get_attributes_bulk(
+                    game,
+                    (dalcom_data["GroupData"], dalcom_data.get("URLs")),
+                    artist_codes,
+                    {"emblemImage": True},
+                )
+            )["emblemImage"]
+
+            artist = {}
+            for artist_name, artist_code, emblem in zip(
+                artist_songs, artist_codes, emblems
+            ):
+                member_count = artist_index["members"].get(artist_code, 0)
+
+                # Calculate base max score
+                max_score = (
+                    game_details["base_score"] + 15_000 * (member_count - 3)
+                    if "base_score" in game_details
+                    else 0
+                )
 
-                for folder in drive_folders["files"]:
-                    if folder["name"] == game_details["name"]:
-                        border_folder = folder["id"]
-                        break
-                else:
-                    metadata: "File" = {
-                        "name": game_details["name"],
-                        "mimeType": FOLDER_MIME,
-                        "parents": [BORDER_FOLDER],
-                    }
-                    border_folder = (await drive_cog.create_file(metadata))[0]
-
-                next_page = ""
-                while True:
-                    border_files = await drive_cog.get_file_list(
-                        border_folder, next_page=next_page
+                artist[artist_name] = {
+                    "code": artist_code,
+                    "emblem": emblem,
+                    "count": member_count,
+                    "score": max_score,
+                }
+
+                if max_live is not None:
+                    max_live += (
+                        15_000
+                        * member_count
+                        * len(artist_index["themes"].get(artist_code, []))
                     )
-                    for file in border_files["files"]:
-                        borders.pop(file["name"], None)
-                    if not (next_page := border_files.get("nextPageToken", "")):
-                        break
-
-                if borders:
-                    self.LOGGER.info("Uploading borders: %s...", game_details["name"])
-                    for border_name, border_key in borders.items():
-                        border_file_path = await ss_cog.extract_file_from_bundle(
-                            game, border_key
-                        )
-                        if not border_file_path:
-                            continue
-
-                        border_media = None
-                        for path in border_file_path.parent.iterdir():
-                            if not path.is_file():
-                                continue
-
-                            with open(path, "rb") as f:
-                                header = f.read(8)
-                                if header == b"\x89PNG\r\n\x1a\n":
-                                    border_media = MediaFileUpload(path)
-                                    break
-                        if not border_media:
-                            continue
-
-                        metadata = {"name": border_name, "parents": [border_folder]}
-                        link = (await drive_cog.create_file(metadata, border_media))[2]
-                        await border_channel.send(
-                            f"{game_details["name"]}: "
-                            f"{border_name.replace(r"<", r"\<")}\n<{link}>"
-                        )
 
-                continue
+            self.bot.artist[game] = artist
+            self.bot.live_theme[game]["max"] = max_live if max_live else 0
 
-            try:
-                ajs_path = Path(f"data/dalcom/{game}/a.json")
-                if ajs_path.exists():
-                    with open(ajs_path, "r", encoding="utf-8-sig") as f:
-                        stored_ajs = json.load(f)
-                else:
-                    stored_ajs = defaultdict(lambda: defaultdict(dict))
-
-                if "iconUrl" in game_details:
-                    ajs = {"code": 1000, "result": stored_ajs}
-                    stored_ajs = ajs
-                else:
-                    ajs = await ss_cog.get_a_json(game)
-
-                refresh = False
-                if ajs["code"] != 1000:
-                    ajs = stored_ajs
-                elif (
-                    not stored_ajs
-                    or ajs["result"]["version"] != stored_ajs["result"]["version"]
-                ):
-                    refresh = True
-                if not ajs:
-                    continue
-
-                data_files = [
-                    "ArtistData",
-                    "GroupData",
-                    "HiddenGameData",
-                    "LiveThemeData",
-                    "LocaleData",
-                    "MusicData",
-                    "ThemeData",
-                    "SeqData",
-                    "ThemeTypeData",
-                    "URLs",
-                    "WorldRecordData",
-                ]
-
-                dalcom_data = {}
-                for data_file in data_files:
-                    if data_file not in ajs["result"]["context"]:
-                        continue
+            if "SeqData" in dalcom_data:
+                seq_search = (dalcom_data["SeqData"], dalcom_data.get("URLs"))
+                seqs = list(dalcom_data["SeqData"].values())
+                seq_keys = (
+                    await ss_cog.get_attributes_bulk(
+                        game,
+                        seq_search,
+                        [seq["code"] for seq in seqs],
+                        {"seqPath": True},
+                        extract=False,
+                    )
+                )["seqPath"]
 
-                    data_path = Path(f"data/dalcom/{game}/{data_file}.json")
+                changed_seqs = []
+                for seq, found_key in zip(seqs, seq_keys):
+                    seq_info = (
+                        self.bot.info_from_file[game]
+                        .setdefault(str(seq["linkedMusic"]), {})
+                        .setdefault("seq", {})
+                        .setdefault(str(seq["seqLevel"]), {})
+                    )
+                    found_dependency = (
+                        self.bot.basic[game]
+                        .get("catalog", {})
+                        .get(found_key, {})
+                        .get("dependency")
+                    )
                     if (
-                        not stored_ajs
-                        or data_file not in stored_ajs["result"]["context"]
-                        or ajs["result"]["context"][data_file]["version"]
-                        != stored_ajs["result"]["context"][data_file]["version"]
-                        or refresh
-                        or not data_path.exists()
+                        seq_info.get("key") == found_key
+                        and seq_info.get("dependency") == found_dependency
                     ):
-                        data = await ss_cog.get_data(
-                            ajs["result"]["context"][data_file]["file"]
-                        )
-                        data_path.parent.mkdir(parents=True, exist_ok=True)
-                        with open(data_path, "w", encoding="utf-8") as f:
-                            json.dump(data, f, indent=4)
-                    else:
-                        with open(data_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                        if isinstance(data, list):
-                            new_data = {str(item["code"]): item for item in data}
-                            with open(data_path, "w", encoding="utf-8") as f:
-                                json.dump(new_data, f, indent=4)
-                            data = new_data
-                    dalcom_data[data_file] = data
-
-                if refresh:
-                    ajs_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(ajs_path, "w", encoding="utf-8") as f:
-                        json.dump(ajs, f, indent=4)
-
-                # Check if game has Live Theme Collection Reward
-                max_live = None
-                if "LiveThemeData" in dalcom_data and "collectRewardID" in next(
-                    iter(dalcom_data["LiveThemeData"].values())
-                ):
-                    max_live = 0
-
-                artist_name_index = game_details["spreadsheet"]["columns"][0].index(
-                    "artist_name"
-                )
-                artist = {}
-                for song_id, song in self.bot.info_by_id[game].items():
-                    artist_name = song[artist_name_index]
-                    if artist_name in artist:
                         continue
+                    changed_seqs.append((seq, found_key, found_dependency))
 
-                    # Find artist code using song ID
-                    int_song_id = int(song_id)
-                    results = await ss_cog.get_attributes(
+                src_paths = (
+                    await ss_cog.get_attributes_bulk(
                         game,
-                        (dalcom_data["MusicData"], dalcom_data.get("URLs")),
-                        [int_song_id],
-                        {"groupData": False},
-                    )
-                    artist_code = results[int_song_id]["groupData"]
-
-                    # Get artist emblem
-                    results = await ss_cog.get_attributes(
-                        game,
-                        (dalcom_data["GroupData"], dalcom_data.get("URLs")),
-                        [artist_code],
-                        {"emblemImage": True},
+                        seq_search,
+                        [seq["code"] for seq, _, _ in changed_seqs],
+                        {"seqPath": True},
                     )
-                    emblem = results[artist_code]["emblemImage"]
-
-                    # Count members
-                    member_count = 0
-                    for member in dalcom_data["ArtistData"].values():
-                        if (
-                            member["group"] == artist_code
-                            and member.get("artistType", 1) != 4
-                        ):
-                            member_count += 1
-
-                    # Calculate base max score
-                    max_score = (
-                        game_details["base_score"] + 15_000 * (member_count - 3)
-                        if "base_score" in game_details
-                        else 0
+                )["seqPath"]
+                for (seq, found_key, found_dependency), src_path in zip(
+                    changed_seqs, src_paths
+                ):
+                    if not src_path:
+                        if found_key:
+                            pending_keys.append(found_key)
+                        continue
+                    dst_path = Path(
+                        f"data/MusicData/{game}"
+                        f"/{seq["linkedMusic"]}_{seq["seqLevel"]}.seq"
                     )
-
-                    artist[artist_name] = {
-                        "code": artist_code,
-                        "emblem": emblem,
-                        "count": member_count,
-                        "score": max_score,
+                    await self.copy_file(src_path, dst_path)
+
+                    seq_summary = self.parse_seq(dst_path)
+                    self.bot.info_from_file[game][str(seq["linkedMusic"])]["seq"][
+                        str(seq["seqLevel"])
+                    ] = {
+                        "count": seq_summary["count"],
+                        "duration": seq_summary["secLength"],
+                        "key": found_key,
+                        "dependency": found_dependency,
                     }
 
-                    if max_live is not None:
-                        for theme in dalcom_data["LiveThemeData"].values():
-                            if theme["groupID"] == artist_code:
-                                max_live += 15_000 * member_count
+                difficulties = {}
+            else:
+                difficulties = {
+                    "seqEasy": "_4.seq",
+                    "seqNormal": "_7.seq",
+                    "seqHard": "_13.seq",
+                }
+
+            music_search = (dalcom_data["MusicData"], dalcom_data.get("URLs"))
+            musics = list(dalcom_data["MusicData"].values())
+            music_results = await ss_cog.get_attributes_bulk(
+                game,
+                music_search,
+                [music["code"] for music in musics],
+                {"localeName": False, "isHidden": False, "sound": True}
+                | dict.fromkeys(difficulties, True),
+                extract=False,
+            )
+
+            changed_sounds = []
+            for music, is_hidden, found_key in zip(
+                musics, music_results["isHidden"], music_results["sound"]
+            ):
+                if not is_hidden:
+                    continue
 
-                self.bot.artist[game] = artist
-                self.bot.live_theme[game]["max"] = max_live if max_live else 0
+                sound_info = (
+                    self.bot.info_from_file[game]
+                    .setdefault(str(music["code"]), {})
+                    .setdefault("sound", {})
+                )
+                found_dependency = (
+                    self.bot.basic[game]
+                    .get("catalog", {})
+                    .get(found_key, {})
+                    .get("dependency")
+                )
+                if (
+                    sound_info.get("key") == found_key
+                    and sound_info.get("dependency") == found_dependency
+                ):
+                    continue
+                changed_sounds.append((music, found_key, found_dependency))
+
+            skipped_music: set[int] = set()
+            src_paths = (
+                await ss_cog.get_attributes_bulk(
+                    game,
+                    music_search,
+                    [music["code"] for music, _, _ in changed_sounds],
+                    {"sound": True},
+                )
+            )["sound"]
+            sound_paths = []
+            for (music, found_key, found_dependency), src_path in zip(
+                changed_sounds, src_paths
+            ):
+                if not src_path:
+                    skipped_music.add(music["code"])
+                    if found_key:
+                        pending_keys.append(found_key)
+                    continue
+                dst_path = Path(f"data/MusicData/{game}/{music["code"]}.ogg")
+                await self.copy_file(src_path, dst_path)
+                sound_paths.append((music, found_key, found_dependency, dst_path))
+
+            durations = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self.get_sound_duration, dst_path)
+                    for *_, dst_path in sound_paths
+                )
+            )
+            for (music, found_key, found_dependency, _), duration in zip(
+                sound_paths, durations
+            ):
+                duration = int(duration)
+                minutes = duration // 60
+                seconds = str(duration % 60).zfill(2)
+                self.bot.info_from_file[game][str(music["code"])]["sound"] = {
+                    "duration": f"{minutes}:{seconds}",
+                    "key": found_key,
+                    "dependency": found_dependency,
+                }
+
+            for difficulty, extension in difficulties.items():
+                difficulty_key = difficulty.replace("seq", "")
+                changed_seqs = []
+                for music, found_key in zip(musics, music_results[difficulty]):
+                    if music["code"] in skipped_music:
+                        continue
 
-                for seq in dalcom_data.get("SeqData", {}).values():
-                    linked_music = str(seq["linkedMusic"])
-                    seq_level = str(seq["seqLevel"])
-                    current_key = (
+                    seq_info = (
                         self.bot.info_from_file[game]
-                        .setdefault(linked_music, {})
+                        .setdefault(str(music["code"]), {})
                         .setdefault("seq", {})
-                        .setdefault(seq_level, {})
-                        .get("key")
+                        .setdefault(difficulty_key, {})
                     )
-                    dependency = (
-                        self.bot.info_from_file[game]
-                        .setdefault(linked_music, {})
-                        .setdefault("seq", {})
-                        .setdefault(seq_level, {})
-                        .get("dependency")
-                    )
-                    found_key = seq["seqPath"]
-                    if isinstance(found_key, int):
-                        results = await ss_cog.get_attributes(
-                            game,
-                            (dalcom_data["URLs"], None),
-                            [found_key],
-                            {"url": False},
-                        )
-                        found_key = results[found_key]["url"]
                     found_dependency = (
                         self.bot.basic[game]
                         .get("catalog", {})
                         .get(found_key, {})
                         .get("dependency")
                     )
-
                     if (
-                        linked_music in self.bot.info_from_file[game]
-                        and seq_level
-                        in self.bot.info_from_file[game][linked_music].get("seq", {})
-                        and current_key == found_key
-                        and dependency == found_dependency
+                        seq_info.get("key") == found_key
+                        and seq_info.get("dependency") == found_dependency
                     ):
                         continue
+                    changed_seqs.append((music, found_key, found_dependency))
 
-                    results = await ss_cog.get_attributes(
+                src_paths = (
+                    await ss_cog.get_attributes_bulk(
                         game,
-                        (dalcom_data["SeqData"], dalcom_data.get("URLs")),
-                        [seq["code"]],
-                        {"seqPath": True},
+                        music_search,
+                        [music["code"] for music, _, _ in changed_seqs],
+                        {difficulty: True},
                     )
-                    src_path = results[seq["code"]]["seqPath"]
+                )[difficulty]
+                for (music, found_key, found_dependency), src_path in zip(
+                    changed_seqs, src_paths
+                ):
                     if not src_path:
+                        if found_key:
+                            pending_keys.append(found_key)
                         continue
-                    dst_path = Path(
-                        f"data/MusicData/{game}"
-                        f"/{seq["linkedMusic"]}_{seq["seqLevel"]}.seq"
-                    )
-                    await self.copy_file(src_path, dst_path, bundle_folders)
-
-                    seq_obj = Seq(dst_path)
-                    self.bot.info_from_file[game][linked_music]["seq"][seq_level] = {
-                        "count": seq_obj.count,
-                        "duration": seq_obj.SEQData_Info["secLength"],
+                    dst_path = Path(f"data/MusicData/{game}/{music['code']}{extension}")
+                    await self.copy_file(src_path, dst_path)
+
+                    seq_summary = self.parse_seq(dst_path)
+                    self.bot.info_from_file[game][str(music["code"])]["seq"][
+                        difficulty_key
+                    ] = {
+                        "count": seq_summary["count"],
+                        "duration": seq_summary["secLength"],
                         "key": found_key,
                         "dependency": found_dependency,
                     }
 
-                for music in dalcom_data["MusicData"].values():
-                    music_code = str(music["code"])
-                    music_results = await ss_cog.get_attributes(
-                        game,
-                        (dalcom_data["MusicData"], dalcom_data.get("URLs")),
-                        [music["code"]],
-                        {"localeName": False, "isHidden": False},
-                    )
-
-                    if music_results[music["code"]]["isHidden"]:
-                        current_key = (
-                            self.bot.info_from_file[game]
-                            .setdefault(music_code, {})
-                            .setdefault("sound", {})
-                            .get("key")
-                        )
-                        dependency = (
-                            self.bot.info_from_file[game]
-                            .setdefault(music_code, {})
-                            .setdefault("sound", {})
-                            .get("dependency")
-                        )
-                        found_key = music["sound"]
-                        if isinstance(found_key, int):
-                            results = await ss_cog.get_attributes(
-                                game,
-                                (dalcom_data["URLs"], None),
-                                [found_key],
-                                {"url": False},
-                            )
-                            found_key = results[found_key]["url"]
-                        found_dependency = (
-                            self.bot.basic[game]
-                            .get("catalog", {})
-                            .get(found_key, {})
-                            .get("dependency")
-                        )
-
-                        if not (
-                            music_code in self.bot.info_from_file[game]
-                            and current_key == found_key
-                            and dependency == found_dependency
-                        ):
-                            results = await ss_cog.get_attributes(
-                                game,
-                                (dalcom_data["MusicData"], dalcom_data.get("URLs")),
-                                [music["code"]],
-                                {"sound": True},
-                            )
-                            src_path = results[music["code"]]["sound"]
-                            if not src_path:
-                                continue
-                            dst_path = Path(
-                                f"data/MusicData/{game}/{music["code"]}.ogg"
-                            )
-                            await self.copy_file(src_path, dst_path, bundle_folders)
-
-                            duration = int(soundfile.info(dst_path).duration)
-                            minutes = duration // 60
-                            seconds = str(duration % 60).zfill(2)
-                            self.bot.info_from_file[game][music_code]["sound"] = {
-                                "duration": f"{minutes}:{seconds}",
-                                "key": found_key,
-                                "dependency": found_dependency,
-                            }
-
-                    if music_code not in self.bot.info_by_id[game]:
-                        locale_results = await ss_cog.get_attributes(
-                            game,
-                            (dalcom_data["LocaleData"], dalcom_data.get("URLs")),
-                            [music_results[music["code"]]["localeName"]],
-                            {"koKR": False, "enUS": False, "jaJP": False},
-                        )
-                        missing_music.append(
-                            [
-                                music_code,
-                                locale_results[
-                                    music_results[music["code"]]["localeName"]
-                                ]["koKR"],
-                                locale_results[
-                                    music_results[music["code"]]["localeName"]
-                                ]["enUS"],
-                                locale_results[
-                                    music_results[music["code"]]["localeName"]
-                                ]["jaJP"],
-                                music_results[music["code"]]["isHidden"],
-                            ]
-                        )
+            missing_indices = [
+                i
+                for i, music in enumerate(musics)
+                if music["code"] not in skipped_music
+                and str(music["code"]) not in self.bot.info_by_id[game]
+            ]
+            locale_results = await ss_cog.get_attributes_bulk(
+                game,
+                (dalcom_data["LocaleData"], dalcom_data.get("URLs")),
+                [music_results["localeName"][i] for i in missing_indices],
+                {"koKR": False, "enUS": False, "jaJP": False},
+            )
+            for j, i in enumerate(missing_indices):
+                missing_music.append(
+                    [
+                        str(musics[i]["code"]),
+                        locale_results["koKR"][j],
+                        locale_results["enUS"][j],
+                        locale_results["jaJP"][j],
+                        music_results["isHidden"][i],
+                    ]
+                )
 
-                    if "SeqData" in dalcom_data:
-                        seqs = {}
-                    else:
-                        seqs = {
-                            "seqEasy": "_4.seq",
-                            "seqNormal": "_7.seq",
-                            "seqHard": "_13.seq",
-                        }
-
-                    for difficulty, extension in seqs.items():
-                        difficulty_key = difficulty.replace("seq", "")
-                        current_key = (
-                            self.bot.info_from_file[game]
-                            .setdefault(music_code, {})
-                            .setdefault("seq", {})
-                            .setdefault(difficulty_key, {})
-                            .get("key")
-                        )
-                        dependency = (
-                            self.bot.info_from_file[game]
-                            .setdefault(music_code, {})
-                            .setdefault("seq", {})
-                            .setdefault(difficulty_key, {})
-                            .get("dependency")
-                        )
-                        found_key = music[difficulty]
-                        if isinstance(found_key, int):
-                            results = await ss_cog.get_attributes(
-                                game,
-                                (dalcom_data["URLs"], None),
-                                [found_key],
-                                {"url": False},
-                            )
-                            found_key = results[found_key]["url"]
-                        found_dependency = (
-                            self.bot.basic[game]
-                            .get("catalog", {})
-                            .get(found_key, {})
-                            .get("dependency")
-                        )
+            for music in musics:
+                if music["code"] in skipped_music:
+                    continue
 
-                        if (
-                            music_code in self.bot.info_from_file[game]
-                            and difficulty_key
-                            in self.bot.info_from_file[game][music_code].get("seq", {})
-                            and current_key == found_key
-                            and dependency == found_dependency
-                        ):
-                            continue
-
-                        results = await ss_cog.get_attributes(
-                            game,
-                            (dalcom_data["MusicData"], dalcom_data.get("URLs")),
-                            [music["code"]],
-                            {difficulty: True},
-                        )
-                        src_path = results[music["code"]][difficulty]
-                        if not src_path:
-                            continue
-                        dst_path = Path(
-                            f"data/MusicData/{game}/{music['code']}{extension}"
-                        )
-                        await self.copy_file(src_path, dst_path, bundle_folders)
-
-                        seq_obj = Seq(dst_path)
-                        self.bot.info_from_file[game][music_code]["seq"][
-                            difficulty_key
-                        ] = {
-                            "count": seq_obj.count,
-                            "duration": seq_obj.SEQData_Info["secLength"],
-                            "key": found_key,
-                            "dependency": found_dependency,
-                        }
-
-                    duration = min(
-                        self.bot.info_from_file[game][music_code]["seq"][difficulty][
-                            "duration"
-                        ]
-                        for difficulty in self.bot.info_from_file[game][music_code][
-                            "seq"
-                        ]
-                    )
-                    duration = math.floor(duration + 0.5)
-                    minutes = duration // 60
-                    seconds = str(duration % 60).zfill(2)
-                    self.bot.info_from_file[game][music_code][
+                music_code = str(music["code"])
+                duration = min(
+                    self.bot.info_from_file[game][music_code]["seq"][difficulty][
                         "duration"
-                    ] = f"{minutes}:{seconds}"
-
-                missing_music.append(["-", "-", "-", "-", "-"])
-                await sheets_cog.update_sheet_data(
+                    ]
+                    for difficulty in self.bot.info_from_file[game][music_code]["seq"]
+                )
+                duration = math.floor(duration + 0.5)
+                minutes = duration // 60
+                seconds = str(duration % 60).zfill(2)
+                self.bot.info_from_file[game][music_code][
+                    "duration"
+                ] = f"{minutes}:{seconds}"
+
+            missing_music.append(["-", "-", "-", "-", "-"])
+            self.sheet_updates.append(
+                (
+                    game,
                     game_details["spreadsheet"]["id"],
                     game_details["spreadsheet"]["ranges"][0].partition("!")[0]
                     + "!V2:Z",
                     missing_music,
                 )
+            )
 
-                with open(music_info_file, "w", encoding="utf-8") as f:
-                    json.dump(self.bot.info_from_file[game], f, indent=4)
+            self.save_music_info(game, music_info_store)
 
-                for path in bundle_folders:
-                    shutil.rmtree(path)
+            # Get World Record seasons and duration
+            self.update_world_record_seasons(game, dalcom_data)
 
-                # Get World Record seasons and duration
-                current_date = datetime.now(tz=TIMEZONES[game_details["timezone"]])
-                if (
-                    "firstSeason" not in game_details
-                    and "catalogPattern" not in game_details
-                ):
-                    for reward in dalcom_data["WorldRecordData"].values():
-                        season_code = reward["seasonCode"]
-                        if season_code in self.bot.world_record.setdefault(game, {}):
-                            continue
-
-                        start_date = datetime.fromtimestamp(
-                            reward["startAt"] / 1000,
-                            tz=TIMEZONES[game_details["timezone"]],
-                        )
-                        if start_date > current_date:
-                            continue
-                        end_date = datetime.fromtimestamp(
-                            reward["endAt"] / 1000,
-                            tz=TIMEZONES[game_details["timezone"]],
-                        )
-                        self.bot.world_record[game][season_code] = {
-                            "start": start_date,
-                            "end": end_date,
-                        }
+            if "catalogUrl" not in game_details:
+                if not pending_keys:
+                    self.fingerprints[game] = fingerprint
+                return
 
-                if "catalogUrl" not in game_details:
+            theme_index = self.get_theme_index(game, ajs, dalcom_data)
+            for border in dalcom_data["ThemeTypeData"].values():
+                if not border["code"]:
                     continue
 
-                for border in dalcom_data["ThemeTypeData"].values():
-                    if not border["code"]:
-                        continue
+                suffixes = {"_Large": ""}
+                if not (theme := theme_index.get(border["code"])):
+                    continue
+                if theme["nameImageZoom"]:
+                    suffixes["_Zoom"] = "z"
 
-                    suffixes = {"_Large": ""}
-                    for theme in dalcom_data["ThemeData"].values():
-                        if theme["themeTypeCode"] == border["code"]:
-                            if theme["nameImageZoom"]:
-                                suffixes["_Zoom"] = "z"
-                            break
-                    else:
-                        continue
+                if not theme["limitedType"]:
+                    continue
 
-                    if not theme["limitedType"]:
-                        continue
+                results = await ss_cog.get_attributes(
+                    game,
+                    (dalcom_data["LocaleData"], None),
+                    [theme["localeName"]],
+                    {"enUS": False},
+                )
+                name = results[theme["localeName"]]["enUS"]
+                if not name:
+                    continue
 
-                    results = await ss_cog.get_attributes(
-                        game,
-                        (dalcom_data["LocaleData"], None),
-                        [theme["localeName"]],
-                        {"enUS": False},
+                catalog_key = Path(border["gradeR"])
+                for k, v in suffixes.items():
+                    border_name = f"{border["code"]}{v} - {name}{catalog_key.suffix}"
+                    borders[border_name] = str(
+                        catalog_key.with_stem(catalog_key.stem + k)
                     )
-                    name = results[theme["localeName"]]["enUS"]
-                    if not name:
-                        continue
 
-                    catalog_key = Path(border["gradeR"])
-                    for k, v in suffixes.items():
-                        border_name = (
-                            f"{border["code"]}{v} - {name}{catalog_key.suffix}"
-                        )
-                        borders[border_name] = str(
-                            catalog_key.with_stem(catalog_key.stem + k)
-                        )
+            if (
+                await self.sync_borders(
+                    game, borders, drive_folders, border_channel, find_png=False
+                )
+                and not pending_keys
+            ):
+                self.fingerprints[game] = self.fingerprint_game(
+                    game, drive_folders, ajs
+                )
 
-                for folder in drive_folders["files"]:
-                    if folder["name"] == game_details["name"]:
-                        border_folder = folder["id"]
-                        break
-                else:
-                    metadata = {
-                        "name": game_details["name"],
-                        "mimeType": FOLDER_MIME,
-                        "parents": [BORDER_FOLDER],
-                    }
-                    border_folder = (await drive_cog.create_file(metadata))[0]
+        except (json.JSONDecodeError, binascii.Error, ValueError):
+            self.LOGGER.info(
+                "%s server is unavailable. Skipping...", game_details["name"]
+            )
+            return
+        except Exception as e:
+            self.LOGGER.exception(str(e))
+            return
+
+    @staticmethod
+    def get_sound_duration(path: Path) -> float:
+        if (duration := Ogg(path).duration) is not None:
+            return duration
+        return soundfile.info(path).duration
+
+    def save_music_info(self, game: str, music_info_store: MusicInfoStore) -> None:
+        if changed := music_info_store.save(self.bot.info_from_file[game]):
+            self.LOGGER.info(
+                "MusicData info updated: %s: %d entries changed",
+                GAMES[game]["name"],
+                changed,
+            )
+
+    def update_world_record_seasons(
+        self, game: str, dalcom_data: dict[str, dict[str, dict]]
+    ) -> None:
+        game_details = GAMES[game]
+        current_date = datetime.now(tz=TIMEZONES[game_details["timezone"]])
+        if "firstSeason" not in game_details and "catalogPattern" not in game_details:
+            for reward in dalcom_data["WorldRecordData"].values():
+                season_code = reward["seasonCode"]
+                if season_code in self.bot.world_record.setdefault(game, {}):
+                    continue
 
-                next_page = ""
-                while True:
-                    border_files = await drive_cog.get_file_list(
-                        border_folder, next_page=next_page
+                start_date = datetime.fromtimestamp(
+                    reward["startAt"] / 1000,
+                    tz=TIMEZONES[game_details["timezone"]],
+                )
+                if start_date > current_date:
+                    continue
+                end_date = datetime.fromtimestamp(
+                    reward["endAt"] / 1000,
+                    tz=TIMEZONES[game_details["timezone"]],
+                )
+                self.bot.world_record[game][season_code] = {
+                    "start": start_date,
+                    "end": end_date,
+                }
+
+    def fingerprint_game(
+        self, game: str, drive_folders: "FileList", ajs: dict | None = None
+    ) -> str:
+        digest = hashlib.sha256()
+        if ajs:
+            digest.update(
+                json.dumps(
+                    [ajs["result"]["version"], ajs["result"]["context"]],
+                    sort_keys=True,
+                ).encode()
+            )
+        if catalog := self.bot.basic[game].get("catalog"):
+            digest.update(catalog.resource_version.encode())
+        digest.update(json.dumps(self.bot.info_by_id[game], sort_keys=True).encode())
+        for folder in drive_folders["files"]:
+            if folder["name"] == GAMES[game]["name"]:
+                digest.update(folder["id"].encode())
+                break
+        digest.update(
+            json.dumps(self.border_manifest.get(game), sort_keys=True).encode()
+        )
+        return digest.hexdigest()
+
+    def parse_seq(self, path: Path) -> SeqSummary:
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        self.seq_digests[str(path)] = digest
+        if summary := self.seq_cache.get(digest):
+            self.seq_cache_stats["hits"] += 1
+            return summary
+
+        self.seq_cache_stats["misses"] += 1
+        with LazySeq(path) as seq_obj:
+            summary = SeqSummary(
+                count=seq_obj.count,
+                invalid_count=seq_obj.invalid_count,
+                secLength=seq_obj.SEQData_Info["secLength"],
+                header=seq_obj.SEQData_Info,
+            )
+        self.seq_cache[digest] = summary
+        return summary
+
+    @staticmethod
+    def get_seq_objects(path: Path) -> list[dict]:
+        with LazySeq(path) as seq_obj:
+            return seq_obj.SEQData_Object
+
+    def save_seq_cache(self) -> None:
+        SEQ_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = SEQ_CACHE.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"digests": self.seq_digests, "summaries": self.seq_cache},
+                f,
+                separators=(",", ":"),
+            )
+        temp_path.replace(SEQ_CACHE)
+
+    def get_artist_index(
+        self, game: str, ajs: dict, dalcom_data: dict[str, dict[str, dict]]
+    ) -> ArtistIndex:
+        versions = tuple(
+            ajs["result"]["context"].get(data_file, {}).get("version")
+            for data_file in ARTIST_INDEX_FILES
+        )
+        if (cached := self.artist_indexes.get(game)) and cached[0] == versions:
+            return cached[1]
+
+        artist_index = ArtistIndex(members={}, themes={}, songs={})
+        for member in dalcom_data["ArtistData"].values():
+            if member.get("artistType", 1) != 4:
+                artist_index["members"][member["group"]] = (
+                    artist_index["members"].get(member["group"], 0) + 1
+                )
+        for theme in dalcom_data.get("LiveThemeData", {}).values():
+            artist_index["themes"].setdefault(theme["groupID"], []).append(theme)
+        for song_id, song in dalcom_data["MusicData"].items():
+            artist_index["songs"][song_id] = song.get("groupData")
+
+        self.artist_indexes[game] = (versions, artist_index)
+        return artist_index
+
+    def get_theme_index(
+        self, game: str, ajs: dict, dalcom_data: dict[str, dict[str, dict]]
+    ) -> dict[int, dict]:
+        version = ajs["result"]["context"].get("ThemeData", {}).get("version")
+        if (cached := self.theme_indexes.get(game)) and cached[0] == version:
+            return cached[1]
+
+        theme_index: dict[int, dict] = {}
+        for theme in dalcom_data["ThemeData"].values():
+            theme_index.setdefault(theme["themeTypeCode"], theme)
+
+        self.theme_indexes[game] = (version, theme_index)
+        return theme_index
+
+    async def sync_borders(
+        self,
+        game: str,
+        borders: dict[str, str],
+        drive_folders: "FileList",
+        border_channel: discord.TextChannel,
+        find_png: bool,
+    ) -> bool:
+        game_details = GAMES[game]
+        drive_cog: "GoogleDrive" = self.bot.get_cog("GoogleDrive")
+
+        for folder in drive_folders["files"]:
+            if folder["name"] == game_details["name"]:
+                border_folder = folder["id"]
+                break
+        else:
+            metadata: "File" = {
+                "name": game_details["name"],
+                "mimeType": FOLDER_MIME,
+                "parents": [BORDER_FOLDER],
+            }
+            border_folder = (await drive_cog.create_file(metadata))[0]
+
+        # The Drive folder is only listed to seed the local manifest
+        manifest = self.border_manifest.get(game)
+        if not manifest or manifest["folder"] != border_folder:
+            names = []
+            next_page = ""
+            while True:
+                border_files = await drive_cog.get_file_list(
+                    border_folder, next_page=next_page
+                )
+                names.extend(file["name"] for file in border_files["files"])
+                if not (next_page := border_files.get("nextPageToken", "")):
+                    break
+            manifest = self.border_manifest[game] = {
+                "folder": border_folder,
+                "names": names,
+            }
+            self.save_border_manifest()
+
+        uploaded = set(manifest["names"])
+        borders = {k: v for k, v in borders.items() if k not in uploaded}
+        if not borders:
+            return True
+
+        self.LOGGER.info("Uploading borders: %s...", game_details["name"])
+        extract_queue: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue()
+        upload_queue: asyncio.Queue[tuple[str, Path] | None] = asyncio.Queue(
+            BORDER_QUEUE_SIZE
+        )
+        post_queue: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue(
+            BORDER_QUEUE_SIZE
+        )
+        for border in borders.items():
+            extract_queue.put_nowait(border)
+        for _ in range(BORDER_EXTRACT_WORKERS):
+            extract_queue.put_nowait(None)
+        pending_borders: list[str] = []
+
+        async def extract() -> None:
+            while border := await extract_queue.get():
+                border_name, border_key = border
+                try:
+                    border_file_path = await self.get_border_file(
+                        game, border_key, find_png
                     )
-                    for file in border_files["files"]:
-                        borders.pop(file["name"], None)
-                    if not (next_page := border_files.get("nextPageToken", "")):
-                        break
-
-                if borders:
-                    self.LOGGER.info("Uploading borders: %s...", game_details["name"])
-                    for border_name, border_key in borders.items():
-                        try:
-                            border_file_path = await ss_cog.extract_file_from_bundle(
-                                game, border_key
-                            )
-                            if not border_file_path:
-                                continue
-                            border_media = MediaFileUpload(border_file_path)
-                        except KeyError:
-                            continue
-                        metadata = {"name": border_name, "parents": [border_folder]}
-                        link = (await drive_cog.create_file(metadata, border_media))[2]
-                        await border_channel.send(
-                            f"{game_details["name"]}: "
-                            f"{border_name.replace(r"<", r"\<")}\n<{link}>"
+                except KeyError:
+                    continue
+                if border_file_path:
+                    await upload_queue.put((border_name, border_file_path))
+                else:
+                    pending_borders.append(border_name)
+
+        async def upload() -> None:
+            while border := await upload_queue.get():
+                border_name, border_file_path = border
+                metadata: "File" = {"name": border_name, "parents": [border_folder]}
+                try:
+                    link = (
+                        await drive_cog.create_file(
+                            metadata, MediaFileUpload(border_file_path)
                         )
+                    )[2]
+                except Exception as e:
+                    self.LOGGER.exception(str(e))
+                    pending_borders.append(border_name)
+                    continue
+                manifest["names"].append(border_name)
+                await post_queue.put((border_name, link))
+
+        async def post() -> None:
+            while border := await post_queue.get():
+                border_name, link = border
+                await border_channel.send(
+                    f"{game_details["name"]}: "
+                    f"{border_name.replace(r"<", r"\<")}\n<{link}>"
+                )
 
-            except (json.JSONDecodeError, binascii.Error, ValueError):
-                self.LOGGER.info(
-                    "%s server is unavailable. Skipping...", game_details["name"]
+        try:
+            async with asyncio.TaskGroup() as tg:
+                uploaders = [
+                    tg.create_task(upload()) for _ in range(BORDER_UPLOAD_WORKERS)
+                ]
+                poster = tg.create_task(post())
+                await asyncio.gather(
+                    *(tg.create_task(extract()) for _ in range(BORDER_EXTRACT_WORKERS))
                 )
+                for _ in uploaders:
+                    await upload_queue.put(None)
+                await asyncio.gather(*uploaders)
+                await post_queue.put(None)
+                await poster
+        finally:
+            self.save_border_manifest()
+        return not pending_borders
+
+    async def get_border_file(
+        self, game: str, border_key: str, find_png: bool
+    ) -> Path | None:
+        ss_cog: "SuperStar" = self.bot.get_cog("SuperStar")
+        border_file_path = await ss_cog.extract_file_from_bundle(game, border_key)
+        if not border_file_path or not find_png:
+            return border_file_path
+
+        for path in border_file_path.parent.iterdir():
+            if not path.is_file():
                 continue
-            except Exception as e:
-                self.LOGGER.exception(str(e))
+
+            with open(path, "rb") as f:
+                if f.read(8) == b"\x89PNG\r\n\x1a\n":
+                    return path
+        return None
+
+    def save_border_manifest(self) -> None:
+        BORDER_MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = BORDER_MANIFEST.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.border_manifest, f, separators=(",", ":"))
+        temp_path.replace(BORDER_MANIFEST)
+
+    async def fetch_dalcom_data(
+        self, game: str, ajs: dict, stored_ajs: dict
+    ) -> dict[str, dict[str, dict]]:
+        ss_cog: "SuperStar" = self.bot.get_cog("SuperStar")
+        context = ajs["result"]["context"]
+        stored_context = stored_ajs["result"]["context"] if stored_ajs else {}
+
+        dalcom_data = {}
+        changed_files = []
+        for data_file in DATA_FILES:
+            if data_file not in context:
                 continue
 
-    @staticmethod
-    async def copy_file(src: str | Path, dst: Path, bundle_folders: set[Path]):
+            data_path = Path(f"data/dalcom/{game}/{data_file}.json")
+            stored_details = stored_context.get(data_file, {})
+            if (
+                context[data_file]["version"] != stored_details.get("version")
+                or context[data_file]["file"] != stored_details.get("file")
+                or not data_path.exists()
+            ):
+                changed_files.append(data_file)
+                continue
+
+            # Unchanged tables already loaded are reused instead of re-read
+            if isinstance(data := self.bot.dalcom.get(game, {}).get(data_file), dict):
+                dalcom_data[data_file] = data
+                continue
+
+            with open(data_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, list):
+                new_data = {str(item["code"]): item for item in data}
+                with open(data_path, "w", encoding="utf-8") as f:
+                    json.dump(new_data, f, indent=4)
+                data = new_data
+            dalcom_data[data_file] = data
+
+        if not changed_files:
+            self.bot.dalcom[game] = dalcom_data
+            return dalcom_data
+
+        self.LOGGER.info(
+            "Downloading %s: %s...", ", ".join(changed_files), GAMES[game]["name"]
+        )
+        results = await asyncio.gather(
+            *(
+                ss_cog.get_data(context[data_file]["file"])
+                for data_file in changed_files
+            )
+        )
+
+        for data_file, data in zip(changed_files, results):
+            data_path = Path(f"data/dalcom/{game}/{data_file}.json")
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(data_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=4)
+            dalcom_data[data_file] = data
+
+        self.bot.dalcom[game] = dalcom_data
+        self.LOGGER.info(
+            "Dalcom data stored: %s: %s on disk",
+            GAMES[game]["name"],
+            ", ".join(
+                f"{table} {size / 1048576:.1f} MiB"
+                for table, size in ss_cog.get_dalcom_file_sizes(game).items()
+            ),
+        )
+        return dalcom_data
+
+    async def copy_file(self, src: str | Path, dst: Path):
         dst.parent.mkdir(parents=True, exist_ok=True)
 
         if isinstance(src, Path):
             shutil.copyfile(src, dst)
-            while not src.is_dir() or src.name != "Assets":
-                src = src.parent
-            src = src.parent
-            bundle_folders.add(src)
         else:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(src) as r:
-                    with open(dst, "wb") as f:
-                        f.write(await r.read())
+            ss_cog: "SuperStar" = self.bot.get_cog("SuperStar")
+            async with ss_cog.session.get(src) as r:
+                with open(dst, "wb") as f:
+                    f.write(await r.read())
 
 
 async def setup(bot: "dBot") -> None:
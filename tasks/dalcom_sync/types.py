@@ -1,11 +1,31 @@
+import hashlib
+import json
+import mmap
 import struct
+from functools import cached_property
 from pathlib import Path
+from typing import TypedDict
 
-from .commons import SEQ_LANES, SEQ_PADDING
+import numpy as np
+
+from .commons import OGG_TAIL_SIZE, SEQ_LANES, SEQ_PADDING
+
+
+class ArtistIndex(TypedDict):
+    members: dict[int, int]
+    themes: dict[int, list[dict]]
+    songs: dict[str, int | None]
+
+
+class SeqSummary(TypedDict):
+    count: int
+    invalid_count: int
+    secLength: float
+    header: dict[str, int | float]
 
 
 class Seq:
-    def __init__(self, path: str | Path) -> None:
+    def __init__(self, path: str | Path, vectorized: bool = False) -> None:
         self.SEQData_Info = {}
         self.SEQData_Tempo = []
         self.SEQData_Object = []
@@ -14,6 +34,10 @@ class Seq:
         self.count = 0
         self.invalid_count = 0
 
+        if vectorized:
+            self.parse_vectorized(Path(path).read_bytes())
+            return
+
         with open(path, "rb") as seq:
             self.SEQData_Info["layout"] = struct.unpack("<I", seq.read(4))[0]
             if self.SEQData_Info["layout"] not in SEQ_PADDING:
@@ -117,3 +141,367 @@ class Seq:
                         self.invalid_count += 1
                 seq.seek(SEQ_PADDING[self.SEQData_Info["layout"]], 1)
                 self.SEQData_Event.append(event)
+
+    def parse_vectorized(self, buffer: bytes) -> None:
+        self.SEQData_Info["layout"] = struct.unpack_from("<I", buffer)[0]
+        if self.SEQData_Info["layout"] not in SEQ_PADDING:
+            return
+        padding = SEQ_PADDING[self.SEQData_Info["layout"]]
+
+        info = np.frombuffer(buffer, dtype=self.info_dtype(padding), count=1, offset=4)[
+            0
+        ]
+        for name in info.dtype.names or ():
+            self.SEQData_Info[name] = info[name].item()
+        offset = 4 + info.dtype.itemsize
+
+        tempo_dtype = self.tempo_dtype(padding)
+        self.SEQData_Tempo = np.frombuffer(
+            buffer,
+            dtype=tempo_dtype,
+            count=self.SEQData_Info["tempoCount"],
+            offset=offset,
+        )
+        offset += tempo_dtype.itemsize * self.SEQData_Info["tempoCount"]
+
+        self.SEQData_Object, offset = self.parse_objects(
+            buffer, offset, self.SEQData_Info["objectCount"]
+        )
+
+        channel_dtype = self.channel_dtype()
+        self.SEQData_Channel = np.frombuffer(
+            buffer,
+            dtype=channel_dtype,
+            count=self.SEQData_Info["channelCount"],
+            offset=offset,
+        )
+        offset += channel_dtype.itemsize * self.SEQData_Info["channelCount"]
+
+        self.SEQData_Event = np.frombuffer(
+            buffer,
+            dtype=self.event_dtype(padding),
+            count=self.SEQData_Info["eventCount"],
+            offset=offset,
+        )
+        self.count, self.invalid_count = self.count_events(
+            self.SEQData_Event, self.SEQData_Info
+        )
+
+    @staticmethod
+    def parse_objects(
+        buffer: bytes | mmap.mmap, offset: int, object_count: int, decode: bool = True
+    ) -> tuple[list[dict], int]:
+        objects = []
+        last = {"dataLen": struct.unpack_from("<I", buffer, offset)[0]}
+        offset += 4
+        if last["dataLen"]:
+            if decode:
+                last["data"] = bytes(buffer[offset : offset + last["dataLen"]]).decode(
+                    "utf-8"
+                )
+            offset += last["dataLen"]
+        for _ in range(object_count - 1):
+            prop, data_len = struct.unpack_from("<II", buffer, offset)
+            offset += 8
+            if data_len:
+                if decode:
+                    objects.append(
+                        {
+                            "property": prop,
+                            "dataLen": data_len,
+                            "data": bytes(buffer[offset : offset + data_len]).decode(
+                                "utf-8"
+                            ),
+                        }
+                    )
+                offset += data_len
+        last["property"] = struct.unpack_from("<I", buffer, offset)[0]
+        offset += 4
+        if last["dataLen"] and decode:
+            objects.append(last)
+        return objects, offset
+
+    @staticmethod
+    def count_events(events: np.ndarray, info: dict) -> tuple[int, int]:
+        # The first and last events are markers and are never counted
+        inner = events[1:-1]
+        valid = (inner["tick"] < info["tickLength"]) & (inner["duration"] == 0)
+        if valid.any():
+            valid &= np.isin(inner["channelId"], SEQ_LANES[info["type"]])
+        count = int(np.count_nonzero(valid))
+        invalid_count = len(inner) - count
+        if info["layout"] != 0x67 or not count:
+            return count, invalid_count
+
+        properties = inner["property"][valid].astype(np.int64)
+        digits = np.ones_like(properties)
+        for power in range(1, 10):
+            digits += properties >= 10**power
+        first = properties // 10 ** (digits - 1)
+        sliders = (first == 1) | (first == 2)
+        if (sliders & (digits < 2)).any():
+            raise IndexError("string index out of range")
+
+        # Slider ends ("x1") right after a slider gap ("x4") count twice,
+        # gaps themselves are not counted
+        second = properties // 10 ** np.maximum(digits - 2, 0) % 10
+        for lane in (1, 2):
+            lane_second = second[sliders & (first == lane)]
+            after_gap = np.zeros(len(lane_second), dtype=bool)
+            after_gap[1:] = lane_second[:-1] == 4
+            count += int(np.count_nonzero((lane_second == 1) & after_gap))
+            count -= int(np.count_nonzero(lane_second == 4))
+        return count, invalid_count
+
+    @staticmethod
+    def info_dtype(padding: int) -> np.dtype:
+        return np.dtype(
+            {
+                "names": [
+                    "tickLength",
+                    "secLength",
+                    "tickPerBeat",
+                    "beatPerTick",
+                    "tempoCount",
+                    "objectCount",
+                    "channelCount",
+                    "eventCount",
+                    "measureCount",
+                    "beatCount",
+                    "type",
+                ],
+                "formats": ["<u4", "<f8", "<u4", "<f8"] + ["<u4"] * 7,
+                "offsets": [0, 4, 12, 16 + padding]
+                + [24 + padding + 4 * i for i in range(7)],
+                "itemsize": 52 + padding * 2,
+            }
+        )
+
+    @staticmethod
+    def tempo_dtype(padding: int) -> np.dtype:
+        return np.dtype(
+            {
+                "names": [
+                    "tick",
+                    "tickEnd",
+                    "sec",
+                    "secEnd",
+                    "beatPerMinute",
+                    "beatPerMeasure",
+                    "measurePerBeat",
+                    "measurePerTick",
+                    "tickPerMeasure",
+                    "beatPerSec",
+                    "secPerBeat",
+                    "tickPerSec",
+                    "secPerTick",
+                    "measurePerSec",
+                    "secPerMeasure",
+                    "measureStart",
+                    "measureCount",
+                ],
+                "formats": ["<u4", "<u4", "<f4", "<f4", "<f8", "<u4", "<f8", "<f8"]
+                + ["<u4"]
+                + ["<f8"] * 6
+                + ["<u4", "<u4"],
+                "offsets": [0, 4, 8, 12, 16, 24, 28 + padding, 36 + padding]
+                + [44 + padding]
+                + [48 + padding * 2 + 8 * i for i in range(6)]
+                + [96 + padding * 2, 100 + padding * 2],
+                "itemsize": 104 + padding * 2,
+            }
+        )
+
+    @staticmethod
+    def channel_dtype() -> np.dtype:
+        return np.dtype([("eventCount", "<u4"), ("property", "<u4")])
+
+    @staticmethod
+    def event_dtype(padding: int) -> np.dtype:
+        return np.dtype(
+            {
+                "names": ["tick", "duration", "channelId", "objectId", "property"],
+                "formats": ["<u4"] * 5,
+                "offsets": [0, 4, 8, 12, 16],
+                "itemsize": 20 + padding,
+            }
+        )
+
+
+class LazySeq(Seq):
+    def __init__(self, path: str | Path) -> None:
+        self.SEQData_Info = {}
+        self.count = 0
+        self.invalid_count = 0
+        self.offsets: dict[str, int] = {}
+
+        with open(path, "rb") as seq:
+            self.buffer = mmap.mmap(seq.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.SEQData_Info["layout"] = struct.unpack_from("<I", self.buffer)[0]
+        if self.SEQData_Info["layout"] not in SEQ_PADDING:
+            return
+        self.padding = SEQ_PADDING[self.SEQData_Info["layout"]]
+
+        info_dtype = self.info_dtype(self.padding)
+        info = np.frombuffer(self.buffer, dtype=info_dtype, count=1, offset=4)[0]
+        for name in info.dtype.names or ():
+            self.SEQData_Info[name] = info[name].item()
+        del info
+
+        self.offsets["tempo"] = 4 + info_dtype.itemsize
+        self.offsets["object"] = (
+            self.offsets["tempo"]
+            + self.tempo_dtype(self.padding).itemsize * self.SEQData_Info["tempoCount"]
+        )
+        _, self.offsets["channel"] = self.parse_objects(
+            self.buffer,
+            self.offsets["object"],
+            self.SEQData_Info["objectCount"],
+            decode=False,
+        )
+        self.offsets["event"] = (
+            self.offsets["channel"]
+            + self.channel_dtype().itemsize * self.SEQData_Info["channelCount"]
+        )
+
+        self.count, self.invalid_count = self.count_events(
+            self.SEQData_Event, self.SEQData_Info
+        )
+
+    def __enter__(self) -> "LazySeq":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.__dict__.pop("SEQData_Event", None)
+        self.buffer.close()
+
+    @cached_property
+    def SEQData_Tempo(self) -> list[dict]:
+        if "tempo" not in self.offsets:
+            return []
+        tempos = np.frombuffer(
+            self.buffer,
+            dtype=self.tempo_dtype(self.padding),
+            count=self.SEQData_Info["tempoCount"],
+            offset=self.offsets["tempo"],
+        )
+        return [
+            {name: tempo[name].item() for name in tempos.dtype.names or ()}
+            for tempo in tempos
+        ]
+
+    @cached_property
+    def SEQData_Object(self) -> list[dict]:
+        if "object" not in self.offsets:
+            return []
+        return self.parse_objects(
+            self.buffer, self.offsets["object"], self.SEQData_Info["objectCount"]
+        )[0]
+
+    @cached_property
+    def SEQData_Channel(self) -> list[dict]:
+        if "channel" not in self.offsets:
+            return []
+        channels = np.frombuffer(
+            self.buffer,
+            dtype=self.channel_dtype(),
+            count=self.SEQData_Info["channelCount"],
+            offset=self.offsets["channel"],
+        )
+        return [
+            {
+                "eventCount": channel["eventCount"].item(),
+                "property": channel["property"].item(),
+            }
+            for channel in channels
+        ]
+
+    @cached_property
+    def SEQData_Event(self) -> np.ndarray:
+        if "event" not in self.offsets:
+            return np.empty(0, dtype=self.event_dtype(0))
+        return np.frombuffer(
+            self.buffer,
+            dtype=self.event_dtype(self.padding),
+            count=self.SEQData_Info["eventCount"],
+            offset=self.offsets["event"],
+        )
+
+
+class Ogg:
+    def __init__(self, path: str | Path) -> None:
+        self.sample_rate = 0
+        self.granule_position = -1
+        with open(path, "rb") as f:
+            # First page carries the Vorbis identification header
+            header = f.read(128)
+            if header[:4] != b"OggS":
+                return
+            serial = header[14:18]
+            packet = 27 + header[26]
+            if header[packet : packet + 7] != b"\x01vorbis":
+                return
+            self.sample_rate = struct.unpack_from("<I", header, packet + 12)[0]
+
+            # Last page with a granule position gives the total sample count
+            f.seek(0, 2)
+            end = f.tell()
+            f.seek(max(0, end - OGG_TAIL_SIZE))
+            tail = f.read()
+        offset = len(tail)
+        while (offset := tail.rfind(b"OggS", 0, offset)) != -1:
+            if tail[offset + 14 : offset + 18] == serial:
+                granule_position = struct.unpack_from("<q", tail, offset + 6)[0]
+                if granule_position != -1:
+                    self.granule_position = granule_position
+                    break
+
+    @property
+    def duration(self) -> float | None:
+        if self.sample_rate <= 0 or self.granule_position < 0:
+            return None
+        return self.granule_position / self.sample_rate
+
+
+class MusicInfoStore:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.digests: dict[str, bytes] = {}
+
+    def load(self) -> dict[str, dict]:
+        entries = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        self.track(entries)
+        return entries
+
+    def track(self, entries: dict[str, dict]) -> None:
+        self.digests = {k: self.digest(v) for k, v in entries.items()}
+
+    def save(self, entries: dict[str, dict]) -> int:
+        digests = {k: self.digest(v) for k, v in entries.items()}
+        changed = sum(self.digests.get(k) != v for k, v in digests.items()) + sum(
+            k not in digests for k in self.digests
+        )
+        if not changed:
+            return 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, separators=(",", ":"))
+        temp_path.replace(self.path)
+        self.digests = digests
+        return changed
+
+    @staticmethod
+    def digest(entry: dict) -> bytes:
+        return hashlib.blake2b(
+            json.dumps(entry, sort_keys=True, separators=(",", ":")).encode(),
+            digest_size=16,
+        ).digest()
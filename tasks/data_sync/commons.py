@@ -1 +1,2 @@
 DATA_FOLDER = "1Nk7Ik6Tqfz3m5ohldzQ4aRpKZBOWMe__"
+DATA_FIELDS = "id,name,modifiedTime,md5Checksum,size"
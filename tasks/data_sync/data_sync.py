@@ -1,10 +1,12 @@
 # mypy: disable-error-code="assignment"
 # pyright: reportAssignmentType=false, reportTypedDictNotRequiredAccess=false
 
+import hashlib
 import json
 import logging
 from collections import defaultdict
 from datetime import time
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from discord.ext import commands, tasks
@@ -13,7 +15,7 @@ from googleapiclient.http import MediaFileUpload
 from statics.consts import Data
 from statics.types import LastAppearance
 
-from .commons import DATA_FOLDER
+from .commons import DATA_FIELDS, DATA_FOLDER
 
 if TYPE_CHECKING:
     from googleapiclient._apis.drive.v3 import File
@@ -40,33 +42,54 @@ class DataSync(commands.Cog):
 
     async def data_download(self) -> None:
         cog: "GoogleDrive" = self.bot.get_cog("GoogleDrive")
-        drive_files = await cog.get_file_list(DATA_FOLDER)
+        drive_files = {
+            file["name"]: file
+            for file in (await cog.get_file_list(DATA_FOLDER, fields=DATA_FIELDS))[
+                "files"
+            ]
+        }
         if Data.LAST_MODIFIED.value.exists():
             with open(Data.LAST_MODIFIED.value, "r", encoding="utf-8") as f:
                 last_modified = json.load(f)
         else:
             last_modified = {}
 
+        saved_bytes = saved_requests = 0
+        unchanged: dict[str, float] = {}
         for data_name in Data:
             data = data_name.value
-            for file in drive_files["files"]:
-                if file["name"] != data.name:
+            if not (file := drive_files.get(data.name)):
+                continue
+
+            if data.exists():
+                self.LOGGER.info("Checking %s...", data.name)
+                last_modified_local = last_modified.get(data.name, 0)
+                last_modified_drive = cog.parse_time(file["modifiedTime"]).timestamp()
+
+                if last_modified_local >= last_modified_drive:
+                    continue
+                if self.get_md5(data) == file.get("md5Checksum"):
+                    # Same content, so only the recorded timestamp is behind
+                    unchanged[data.name] = last_modified_drive
+                    saved_bytes += int(file.get("size", 0))
+                    saved_requests += 1
                     continue
 
-                if data.exists():
-                    self.LOGGER.info("Checking %s...", data.name)
-                    last_modified_local = last_modified.get(data.name, 0)
-                    last_modified_drive = (
-                        await cog.get_file_last_modified(file["id"])
-                    ).timestamp()
+            self.LOGGER.info("Downloading %s...", data.name)
+            data.parent.mkdir(parents=True, exist_ok=True)
+            await cog.get_file(file["id"], data)
 
-                    if last_modified_local >= last_modified_drive:
-                        continue
+        if unchanged:
+            # The timestamps file itself may have just been downloaded
+            if Data.LAST_MODIFIED.value.exists():
+                with open(Data.LAST_MODIFIED.value, "r", encoding="utf-8") as f:
+                    last_modified = json.load(f)
+            last_modified.update(unchanged)
+            self.save_data(Data.LAST_MODIFIED, last_modified)
 
-                self.LOGGER.info("Downloading %s...", data.name)
-                data.parent.mkdir(parents=True, exist_ok=True)
-                await cog.get_file(file["id"], data)
-                break
+        self.LOGGER.info(
+            "Data download: saved %d bytes, %d requests", saved_bytes, saved_requests
+        )
 
         if Data.WORD_PINGS.value.exists():
             self.bot.word_pings.clear()
@@ -153,28 +176,48 @@ class DataSync(commands.Cog):
     @tasks.loop(time=[time(hour=h, minute=1) for h in range(24)])
     async def data_upload(self) -> None:
         cog: "GoogleDrive" = self.bot.get_cog("GoogleDrive")
-        drive_files = await cog.get_file_list(DATA_FOLDER)
+        drive_files = {
+            file["name"]: file
+            for file in (await cog.get_file_list(DATA_FOLDER, fields=DATA_FIELDS))[
+                "files"
+            ]
+        }
         last_modified = {}
 
+        saved_bytes = saved_requests = 0
         for data_name in Data:
             data = data_name.value
             data.touch(exist_ok=True)
-            self.LOGGER.info("Uploading %s...", data.name)
-            media = MediaFileUpload(data)
 
-            for file in drive_files["files"]:
-                if file["name"] == data.name:
-                    last_modified[data.name] = (
-                        await cog.update_drive_file(file["id"], media)
+            if file := drive_files.get(data.name):
+                if self.get_md5(data) == file.get("md5Checksum"):
+                    last_modified[data.name] = cog.parse_time(
+                        file["modifiedTime"]
                     ).timestamp()
-                    break
+                    saved_bytes += data.stat().st_size
+                    saved_requests += 1
+                    continue
+
+                self.LOGGER.info("Uploading %s...", data.name)
+                last_modified[data.name] = (
+                    await cog.update_drive_file(file["id"], MediaFileUpload(data))
+                ).timestamp()
             else:
+                self.LOGGER.info("Uploading %s...", data.name)
                 metadata: "File" = {"name": data.name, "parents": [DATA_FOLDER]}
-                last_modified[data.name] = (await cog.create_file(metadata, media))[
-                    1
-                ].timestamp()
+                last_modified[data.name] = (
+                    await cog.create_file(metadata, MediaFileUpload(data))
+                )[1].timestamp()
 
         self.save_data(Data.LAST_MODIFIED, last_modified)
+        self.LOGGER.info(
+            "Data upload: saved %d bytes, %d requests", saved_bytes, saved_requests
+        )
+
+    @staticmethod
+    def get_md5(path: Path) -> str:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "md5").hexdigest()
 
     def save_data(self, data: Data, content: dict | None = None) -> None:
         if not content:
@@ -2,7 +2,6 @@ import asyncio
 import binascii
 import json
 from datetime import datetime, time, timedelta
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 import aiohttp
@@ -37,6 +36,7 @@ class ForwardUpdate(commands.Cog):
 
     @tasks.loop(time=[time(hour=h, minute=15) for h in range(24)])
     async def queue_update(self) -> None:
+        cog: "SuperStar" = self.bot.get_cog("SuperStar")  # type: ignore[assignment]
         for game, game_details in GAMES.items():
             if (
                 not (forward_details := game_details.get("forward"))
@@ -50,10 +50,8 @@ class ForwardUpdate(commands.Cog):
                     self.forward_update(game, forward_details, game_details)
                 )
                 self.queue[game] = task
-            elif (msd_path := Path(f"data/dalcom/{game}/MusicData.json")).exists():
+            elif msd := cog.get_dalcom_table(game, "MusicData"):
                 current_time = datetime.now(tz=TIMEZONES[game_details["timezone"]])
-                with open(msd_path, "r", encoding="utf-8") as f:
-                    msd = json.load(f)
                 for song in msd.values():
                     if (display_start := song.get("displayStartAt")) and (
                         (
@@ -73,11 +71,7 @@ class ForwardUpdate(commands.Cog):
                         self.queue[game] = task
                         break
                 else:
-                    if (
-                        grd_path := Path(f"data/dalcom/{game}/GroupData.json")
-                    ).exists():
-                        with open(grd_path, "r", encoding="utf-8") as f:
-                            grd = json.load(f)
+                    if grd := cog.get_dalcom_table(game, "GroupData"):
                         for group in grd.values():
                             if (display_start := group.get("displayStartAt")) and (
                                 (
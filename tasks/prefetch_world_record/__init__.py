@@ -0,0 +1,16 @@
+import importlib
+
+from statics.consts import LOCK
+
+from . import commons, prefetch_world_record
+
+if LOCK.exists():
+    for module in (commons, prefetch_world_record):
+        importlib.reload(module)
+
+from .prefetch_world_record import PrefetchWorldRecord, setup
+
+del importlib, commons, prefetch_world_record, LOCK
+
+__all__ = ("setup", "PrefetchWorldRecord")
+__author__ = "ddm135 | Aut"
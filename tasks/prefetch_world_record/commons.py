@@ -0,0 +1,4 @@
+PREFETCH_ENABLED = True
+PREFETCH_INTERVAL = 4  # minutes, below WORLD_RECORD_TTL
+PREFETCH_BATCH = 64  # songs per game per cycle, resumed from a rotating cursor
+PREFETCH_STAGGER = 0.2  # seconds between requests
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from discord.ext import commands, tasks
+
+from statics.consts import GAMES
+
+from .commons import (
+    PREFETCH_BATCH,
+    PREFETCH_ENABLED,
+    PREFETCH_INTERVAL,
+    PREFETCH_STAGGER,
+)
+
+if TYPE_CHECKING:
+    from dBot import dBot
+    from helpers.superstar import SuperStar
+
+
+class PrefetchWorldRecord(commands.Cog):
+    LOGGER = logging.getLogger(__name__.rpartition(".")[0])
+
+    def __init__(self, bot: "dBot") -> None:
+        self.bot = bot
+        self.cursors: dict[str, int] = {}
+
+    async def cog_load(self) -> None:
+        if PREFETCH_ENABLED:
+            self.prefetch_world_records.start()
+
+    async def cog_unload(self) -> None:
+        self.prefetch_world_records.cancel()
+
+    @tasks.loop(minutes=PREFETCH_INTERVAL)
+    async def prefetch_world_records(self) -> None:
+        await asyncio.gather(
+            *(
+                self.prefetch_game(game)
+                for game, game_details in GAMES.items()
+                if "firstSeason" not in game_details
+                and "catalogPattern" not in game_details
+            ),
+            return_exceptions=True,
+        )
+
+    async def prefetch_game(self, game: str) -> None:
+        if not self.bot.world_record.get(game) or game not in self.bot.info_by_name:
+            return
+
+        season_code = max(self.bot.world_record[game])
+        song_id_index = GAMES[game]["spreadsheet"]["columns"][0].index("song_id")
+        cog: "SuperStar" = self.bot.get_cog("SuperStar")
+
+        song_ids = sorted(
+            {
+                int(song[song_id_index])
+                for songs in list(self.bot.info_by_name[game].values())
+                for song in list(songs.values())
+            }
+        )
+        if not song_ids:
+            return
+
+        # Each cycle covers the next batch of songs, wrapping around the list
+        cursor = self.cursors.get(game, 0) % len(song_ids)
+        batch = (song_ids[cursor:] + song_ids[:cursor])[:PREFETCH_BATCH]
+        self.cursors[game] = cursor + len(batch)
+
+        refreshed = 0
+        for song_id in batch:
+            try:
+                await cog.get_world_record(
+                    game, season_code, song_id, True, refresh=True
+                )
+                refreshed += 1
+            except Exception as e:
+                self.LOGGER.warning("World record prefetch failed: %s", e)
+            await asyncio.sleep(PREFETCH_STAGGER)
+
+        self.LOGGER.info(
+            "Prefetched %d/%d world records: %s (season %d)",
+            refreshed,
+            len(song_ids),
+            GAMES[game]["name"],
+            season_code,
+        )
+
+    @prefetch_world_records.before_loop
+    async def before_loop(self) -> None:
+        await self.bot.wait_until_ready()
+
+
+async def setup(bot: "dBot") -> None:
+    await bot.add_cog(PrefetchWorldRecord(bot))